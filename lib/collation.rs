@@ -0,0 +1,313 @@
+use std::borrow::Cow;
+use std::cell::RefCell;
+use std::cmp::{Ordering, Reverse};
+use std::collections::HashMap;
+
+use feruca::{Collator, Locale, Tailoring};
+use rayon::prelude::*;
+use unicode_normalization::char::is_combining_mark;
+use unicode_normalization::UnicodeNormalization;
+
+/// The default number of distinct strings from which on they are sorted in parallel.
+pub const PARALLEL_THRESHOLD: usize = 50_000;
+
+/// The collation tables.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub enum Table {
+    /// The CLDR root collation.
+    Cldr,
+    /// The Default Unicode Collation Element Table.
+    Ducet,
+}
+
+/// The level up to which strings are distinguished.
+///
+/// feruca always collates on all levels, so primary and secondary strength
+/// are approximated by folding the strings before collating them, see
+/// `Options::fold`. Only differences in combining marks and letter case are
+/// folded away: "Straße" and "Strasse" still differ at primary strength,
+/// ligatures and width variants still differ at secondary strength.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub enum Strength {
+    /// Ignores accents and case, "Zürich" equals "zurich".
+    Primary,
+    /// Ignores case, "Zürich" equals "zürich".
+    Secondary,
+    /// Distinguishes base letters, accents and case.
+    Tertiary,
+    /// Breaks the remaining ties by comparing the code points.
+    Identical,
+}
+
+/// The options of a collation.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub struct Options {
+    pub table: Table,
+    /// Whether variable characters (spaces, punctuation) are ignored on the first levels.
+    pub shifting: bool,
+    pub strength: Strength,
+}
+
+impl Default for Options {
+    /// The options of `Collator::default()`.
+    fn default() -> Self {
+        Self {
+            table: Table::Cldr,
+            shifting: true,
+            strength: Strength::Identical,
+        }
+    }
+}
+
+impl Options {
+    /// Folds a string, so that collating the folded strings approximates the strength.
+    ///
+    /// Primary strength strips the combining marks after NFD and lowercases,
+    /// secondary strength lowercases, see `Strength` for the limits.
+    pub fn fold<'a>(&self, input: &'a str) -> Cow<'a, str> {
+        match self.strength {
+            Strength::Primary => Cow::Owned(
+                input
+                    .nfd()
+                    .filter(|c| !is_combining_mark(*c))
+                    .collect::<String>()
+                    .to_lowercase(),
+            ),
+            Strength::Secondary => Cow::Owned(input.to_lowercase()),
+            Strength::Tertiary | Strength::Identical => Cow::Borrowed(input),
+        }
+    }
+
+    fn collator(&self) -> Collator {
+        let tailoring = match self.table {
+            Table::Cldr => Tailoring::Cldr(Locale::Root),
+            Table::Ducet => Tailoring::Ducet,
+        };
+        Collator::new(
+            tailoring,
+            self.shifting,
+            self.strength == Strength::Identical,
+        )
+    }
+}
+
+thread_local! {
+    // a collator keeps buffers between comparisons, so every thread gets its own
+    // collator per options, which is reused by all later calls on this thread
+    static COLLATORS: RefCell<HashMap<Options, Collator>> = RefCell::new(HashMap::new());
+}
+
+/// Runs the given function with the collator of the current thread for the options.
+///
+/// The function must not call `with_collator` itself.
+///
+pub fn with_collator<R>(options: &Options, f: impl FnOnce(&mut Collator) -> R) -> R {
+    COLLATORS.with(|collators| {
+        let mut collators = collators.borrow_mut();
+        f(collators
+            .entry(*options)
+            .or_insert_with(|| options.collator()))
+    })
+}
+
+/// Collates two strings with the given options.
+pub fn compare(a: &str, b: &str, options: &Options) -> Ordering {
+    let (a, b) = (options.fold(a), options.fold(b));
+    collate(&a, &b, options)
+}
+
+/// Collates two strings, which are already folded with `Options::fold`.
+pub fn collate(a: &str, b: &str, options: &Options) -> Ordering {
+    with_collator(options, |collator| collator.collate(a, b))
+}
+
+/// Computes the dense rank of each string in UCA order among the given strings.
+///
+/// Duplicates are collated only once: the distinct strings are sorted and
+/// numbered, strings which collate equal get the same rank. Comparing the
+/// ranks is equivalent to collating the strings, but only for strings of the
+/// same call, the ranks are not sort keys which could be stored. Below the
+/// identical strength one more collation per distinct string finds the
+/// strings which collate equal.
+///
+/// # Arguments
+///
+/// * `inputs` - The strings to rank.
+/// * `options` - The options of the collation.
+/// * `parallel_threshold` - The number of distinct strings from which on they are sorted on all cores.
+///
+/// # Returns
+///
+/// The rank of each input string, in the order of the inputs.
+///
+pub fn ranks(inputs: &[String], options: &Options, parallel_threshold: usize) -> Vec<u32> {
+    let folded: Vec<Cow<str>> = inputs.iter().map(|input| options.fold(input)).collect();
+    let mut positions: HashMap<&str, usize> = HashMap::with_capacity(folded.len());
+    let mut distinct: Vec<&str> = Vec::new();
+    let ids: Vec<usize> = folded
+        .iter()
+        .map(|input| {
+            let input: &str = input;
+            *positions.entry(input).or_insert_with(|| {
+                distinct.push(input);
+                distinct.len() - 1
+            })
+        })
+        .collect();
+
+    let mut order: Vec<usize> = (0..distinct.len()).collect();
+    if order.len() >= parallel_threshold {
+        order.par_sort_unstable_by(|&a, &b| {
+            with_collator(options, |collator| {
+                collator.collate(distinct[a], distinct[b])
+            })
+        });
+    } else {
+        with_collator(options, |collator| {
+            order.sort_unstable_by(|&a, &b| collator.collate(distinct[a], distinct[b]))
+        });
+    }
+
+    let mut distinct_ranks = vec![0u32; distinct.len()];
+    if options.strength == Strength::Identical {
+        // the tie-break orders the distinct strings, only equal strings collate equal
+        for (rank, &i) in order.iter().enumerate() {
+            distinct_ranks[i] = rank as u32;
+        }
+    } else {
+        with_collator(options, |collator| {
+            for i in 1..order.len() {
+                let (previous, current) = (order[i - 1], order[i]);
+                let is_equal =
+                    collator.collate(distinct[previous], distinct[current]) == Ordering::Equal;
+                distinct_ranks[current] = distinct_ranks[previous] + u32::from(!is_equal);
+            }
+        });
+    }
+
+    ids.into_iter().map(|id| distinct_ranks[id]).collect()
+}
+
+/// Sorts the items by their UCA ranks, see `ranks`.
+///
+/// # Arguments
+///
+/// * `ranks` - The rank of each item.
+/// * `items` - The items to sort.
+/// * `reverse` - Whether to sort in descending order.
+/// * `stable` - Whether to keep the order of items with an equal rank, as Python's `sorted` does.
+///
+/// # Returns
+///
+/// The sorted items.
+///
+pub fn sort_by_ranks<T>(ranks: Vec<u32>, items: Vec<T>, reverse: bool, stable: bool) -> Vec<T> {
+    let mut ranked: Vec<(u32, T)> = ranks.into_iter().zip(items).collect();
+    match (stable, reverse) {
+        (true, false) => ranked.sort_by_key(|(rank, _)| *rank),
+        (true, true) => ranked.sort_by_key(|(rank, _)| Reverse(*rank)),
+        (false, false) => ranked.sort_unstable_by_key(|(rank, _)| *rank),
+        (false, true) => ranked.sort_unstable_by_key(|(rank, _)| Reverse(*rank)),
+    }
+    ranked.into_iter().map(|(_, item)| item).collect()
+}
+
+/// Selects the first `k` strings in UCA order with a partial sort.
+///
+/// Only the selected strings are sorted, so this takes O(n + k log k)
+/// comparisons instead of sorting all strings. Equal strings are ordered
+/// by their position, the result equals the first `k` items of a stable sort.
+///
+/// # Arguments
+///
+/// * `inputs` - The strings.
+/// * `k` - The number of strings to select.
+/// * `options` - The options of the collation.
+/// * `reverse` - Whether to select the last strings in UCA order instead.
+///
+/// # Returns
+///
+/// The indices of the selected strings in their order.
+///
+pub fn top_k(inputs: &[String], k: usize, options: &Options, reverse: bool) -> Vec<usize> {
+    let folded: Vec<Cow<str>> = inputs.iter().map(|input| options.fold(input)).collect();
+    let mut order: Vec<usize> = (0..inputs.len()).collect();
+
+    with_collator(options, |collator| {
+        let mut compare = |&a: &usize, &b: &usize| {
+            let ordering = collator.collate(&*folded[a], &*folded[b]);
+            let ordering = if reverse {
+                ordering.reverse()
+            } else {
+                ordering
+            };
+            ordering.then(a.cmp(&b))
+        };
+        if k == 0 {
+            order.clear();
+        } else if k < order.len() {
+            order.select_nth_unstable_by(k - 1, &mut compare);
+            order.truncate(k);
+        }
+        order.sort_unstable_by(compare);
+    });
+    order
+}
+
+/// Selects the first of each group of strings, which are equal with the given options.
+///
+/// # Arguments
+///
+/// * `inputs` - The strings.
+/// * `options` - The options of the collation, its strength defines which strings are equal.
+/// * `parallel_threshold` - The number of distinct strings from which on they are sorted on all cores.
+///
+/// # Returns
+///
+/// The indices of the selected strings in UCA order.
+///
+pub fn unique(inputs: &[String], options: &Options, parallel_threshold: usize) -> Vec<usize> {
+    let ranks = ranks(inputs, options, parallel_threshold);
+    let mut firsts: Vec<Option<usize>> =
+        vec![None; ranks.iter().max().map_or(0, |max| max + 1) as usize];
+    for (i, &rank) in ranks.iter().enumerate() {
+        firsts[rank as usize].get_or_insert(i);
+    }
+    firsts.into_iter().flatten().collect()
+}
+
+/// Merges two UCA-sorted lists of strings.
+///
+/// Equal strings of the left list are taken first, so merging is stable.
+///
+/// # Arguments
+///
+/// * `left` - The first sorted list.
+/// * `right` - The second sorted list.
+/// * `options` - The options of the collation, both lists must be sorted with them.
+///
+/// # Returns
+///
+/// For each position of the merged list, whether its item is taken from the left list.
+///
+pub fn merge_order(left: &[String], right: &[String], options: &Options) -> Vec<bool> {
+    let left: Vec<Cow<str>> = left.iter().map(|input| options.fold(input)).collect();
+    let right: Vec<Cow<str>> = right.iter().map(|input| options.fold(input)).collect();
+    let mut order = Vec::with_capacity(left.len() + right.len());
+    let (mut i, mut j) = (0, 0);
+
+    with_collator(options, |collator| {
+        while i < left.len() && j < right.len() {
+            let take_left = collator.collate(&*left[i], &*right[j]) != Ordering::Greater;
+            order.push(take_left);
+            if take_left {
+                i += 1;
+            } else {
+                j += 1;
+            }
+        }
+    });
+    order.extend(std::iter::repeat(true).take(left.len() - i));
+    order.extend(std::iter::repeat(false).take(right.len() - j));
+    order
+}
@@ -0,0 +1,146 @@
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+/// The fields of a parsed IDNO, in the order of the `IDNO` model:
+/// prefix, kanton, volume, case, opening, doc, num and special.
+pub type IdnoFields = (
+    String,
+    String,
+    String,
+    Option<u64>,
+    Option<String>,
+    Option<u64>,
+    Option<u64>,
+    Option<String>,
+);
+
+const PREFIXES: [&str; 3] = ["SSRQ", "SDS", "FDS"];
+const SPECIALS: [&str; 3] = ["lit", "intro", "bailiffs"];
+
+fn is_alphanumeric(part: &str) -> bool {
+    !part.is_empty() && part.bytes().all(|b| b.is_ascii_alphanumeric())
+}
+
+fn is_digits(part: &str) -> bool {
+    !part.is_empty() && part.bytes().all(|b| b.is_ascii_digit())
+}
+
+/// Parses an IDNO by hand, following the grammar of `SCHEMA` in `idno/model.py`.
+///
+/// Numbers beyond 64 bit and a trailing newline (matched by `$` in Python) are
+/// rejected, callers check rejected strings against the schema again.
+///
+/// # Arguments
+///
+/// * `idno` - The IDNO string to parse.
+///
+/// # Returns
+///
+/// The fields of the IDNO or `None` if the string does not match the grammar.
+///
+pub fn parse(idno: &str) -> Option<IdnoFields> {
+    // neither the prefix, the kanton nor the volume may contain a dash
+    let mut parts = idno.splitn(4, '-');
+    let prefix = parts.next()?;
+    let kanton = parts.next()?;
+    let volume = parts.next()?;
+    let rest = parts.next()?;
+
+    if !PREFIXES.contains(&prefix) {
+        return None;
+    }
+    if kanton.len() != 2 || !kanton.bytes().all(|b| b.is_ascii_uppercase()) {
+        return None;
+    }
+    if volume.is_empty()
+        || !volume
+            .bytes()
+            .all(|b| b.is_ascii_alphanumeric() || b == b'_')
+    {
+        return None;
+    }
+
+    if SPECIALS.contains(&rest) {
+        return Some((
+            prefix.to_owned(),
+            kanton.to_owned(),
+            volume.to_owned(),
+            None,
+            None,
+            None,
+            None,
+            Some(rest.to_owned()),
+        ));
+    }
+
+    let (body, num) = rest.split_once('-')?;
+    if num != "1" {
+        return None;
+    }
+
+    // the last part of the body is the document, all parts before form the case or opening
+    let (case_or_opening, doc) = match body.rsplit_once('.') {
+        Some((head, doc)) => {
+            if !head.split('.').all(is_alphanumeric) {
+                return None;
+            }
+            (Some(head), doc)
+        }
+        None => (None, body),
+    };
+    if !is_digits(doc) {
+        return None;
+    }
+
+    let (case, opening) = match case_or_opening {
+        Some(head) if is_digits(head) => (Some(head.parse::<u64>().ok()?), None),
+        Some(head) => (None, Some(head.to_owned())),
+        None => (None, None),
+    };
+
+    Some((
+        prefix.to_owned(),
+        kanton.to_owned(),
+        volume.to_owned(),
+        case,
+        opening,
+        Some(doc.parse::<u64>().ok()?),
+        Some(1),
+        None,
+    ))
+}
+
+/// Parses a single IDNO string.
+///
+/// # Arguments
+///
+/// * `idno` - The IDNO string to parse.
+///
+/// # Returns
+///
+/// A `PyResult` containing the fields of the IDNO.
+///
+/// # Errors
+///
+/// This function will return a `ValueError` if the string does not match the grammar.
+///
+#[pyfunction]
+pub fn parse_idno(idno: &str) -> PyResult<IdnoFields> {
+    parse(idno)
+        .ok_or_else(|| PyValueError::new_err(format!("IDNO {idno} does not match the schema")))
+}
+
+/// Parses many IDNO strings, the GIL is released while parsing.
+///
+/// # Arguments
+///
+/// * `idnos` - A vector of IDNO strings to parse.
+///
+/// # Returns
+///
+/// A vector with the fields of each IDNO or `None` if a string does not match the grammar.
+///
+#[pyfunction]
+pub fn parse_idnos(py: Python<'_>, idnos: Vec<String>) -> Vec<Option<IdnoFields>> {
+    py.allow_threads(|| idnos.iter().map(|idno| parse(idno)).collect())
+}
@@ -0,0 +1,151 @@
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
+
+use pyo3::prelude::*;
+use pyo3::types::{PyIterator, PyTuple};
+
+use crate::collation::{self, Options};
+
+/// The current item of one of the merged iterators.
+struct Head {
+    /// The folded string to sort the item by.
+    key: String,
+    /// The position of the iterator, which breaks ties to keep the merge stable.
+    source: usize,
+    item: Py<PyAny>,
+    options: Options,
+    reverse: bool,
+}
+
+impl Ord for Head {
+    /// Orders the heads by priority, the `BinaryHeap` pops the greatest one first.
+    fn cmp(&self, other: &Self) -> Ordering {
+        let ordering = collation::collate(&other.key, &self.key, &self.options);
+        let ordering = if self.reverse {
+            ordering.reverse()
+        } else {
+            ordering
+        };
+        ordering.then_with(|| other.source.cmp(&self.source))
+    }
+}
+
+impl PartialOrd for Head {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl PartialEq for Head {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl Eq for Head {}
+
+/// Lazily merges UCA-sorted iterables, like `heapq.merge`.
+///
+/// Holds one item per iterable, each `__next__` needs O(log k) comparisons
+/// for k iterables. Items with equal keys are returned in the order of the
+/// iterables.
+///
+#[pyclass(module = "ssrq_utils.uca")]
+pub struct UcaMerge {
+    iterators: Vec<Py<PyIterator>>,
+    key: Option<Py<PyAny>>,
+    options: Options,
+    reverse: bool,
+    heads: BinaryHeap<Head>,
+    started: bool,
+}
+
+impl UcaMerge {
+    pub fn new(
+        iterables: &Bound<'_, PyTuple>,
+        key: Option<Bound<'_, PyAny>>,
+        options: Options,
+        reverse: bool,
+    ) -> PyResult<Self> {
+        let iterators = iterables
+            .iter()
+            .map(|iterable| Ok(iterable.try_iter()?.unbind()))
+            .collect::<PyResult<Vec<Py<PyIterator>>>>()?;
+        Ok(Self {
+            heads: BinaryHeap::with_capacity(iterators.len()),
+            iterators,
+            key: key.map(Bound::unbind),
+            options,
+            reverse,
+            started: false,
+        })
+    }
+
+    /// Pulls the next item of an iterator onto the heap.
+    fn advance(&mut self, py: Python<'_>, source: usize) -> PyResult<()> {
+        let Some(item) = self.iterators[source].bind(py).clone().next() else {
+            return Ok(());
+        };
+        let item = item?;
+        let value: String = match &self.key {
+            Some(key) => key.call1(py, (item.clone(),))?.extract(py)?,
+            None => item.extract()?,
+        };
+        self.heads.push(Head {
+            key: self.options.fold(&value).into_owned(),
+            source,
+            item: item.unbind(),
+            options: self.options,
+            reverse: self.reverse,
+        });
+        Ok(())
+    }
+}
+
+#[pymethods]
+impl UcaMerge {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<Py<PyAny>>> {
+        if !self.started {
+            self.started = true;
+            for source in 0..self.iterators.len() {
+                self.advance(py, source)?;
+            }
+        }
+        let Some(head) = self.heads.pop() else {
+            return Ok(None);
+        };
+        self.advance(py, head.source)?;
+        Ok(Some(head.item))
+    }
+}
+
+/// Lazily merges iterables, which are sorted using the Unicode Collation Algorithm.
+///
+/// # Arguments
+///
+/// * `iterables` - The sorted iterables.
+/// * `key` - A function returning the string to sort an item by, the items themselves are used if omitted.
+/// * `reverse` - Whether the iterables are sorted in descending order.
+///
+/// # Returns
+///
+/// A `PyResult` containing an iterator over the merged items.
+///
+/// # Errors
+///
+/// This function will return an error if an argument is not iterable. Errors while
+/// iterating or calling the key function are raised by the returned iterator.
+///
+#[pyfunction]
+#[pyo3(signature = (*iterables, key=None, reverse=false))]
+pub fn uca_merge(
+    iterables: &Bound<'_, PyTuple>,
+    key: Option<Bound<'_, PyAny>>,
+    reverse: bool,
+) -> PyResult<UcaMerge> {
+    UcaMerge::new(iterables, key, Options::default(), reverse)
+}
@@ -1,12 +1,25 @@
-use feruca::Collator;
+use std::cmp::Ordering;
+
+use pyo3::basic::CompareOp;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyTuple;
 
+use crate::collation::{Options, Strength, Table};
+
+mod collation;
+mod idno;
+mod merge;
+
 /// Sorts a list of strings using the Unicode Collation Algorithm.
 ///
+/// The GIL is released while collating, above the `parallel_threshold`
+/// the strings are sorted on all cores.
+///
 /// # Arguments
 ///
 /// * `inputs` - A vector of strings to be sorted.
+/// * `parallel_threshold` - The number of distinct strings from which on they are sorted in parallel.
 ///
 /// # Returns
 ///
@@ -17,19 +30,55 @@ use pyo3::types::PyTuple;
 /// This function will return an error if the collation process fails.
 ///
 #[pyfunction]
-fn uca_simple_sort(mut inputs: Vec<String>) -> PyResult<Vec<String>> {
-    let mut collator = Collator::default();
-    inputs.sort_unstable_by(|a, b| collator.collate(a, b));
-    Ok(inputs)
+#[pyo3(signature = (inputs, parallel_threshold=None))]
+fn uca_simple_sort(
+    py: Python<'_>,
+    inputs: Vec<String>,
+    parallel_threshold: Option<usize>,
+) -> PyResult<Vec<String>> {
+    let threshold = parallel_threshold.unwrap_or(collation::PARALLEL_THRESHOLD);
+    Ok(py.allow_threads(|| {
+        let ranks = collation::ranks(&inputs, &Options::default(), threshold);
+        collation::sort_by_ranks(ranks, inputs, false, false)
+    }))
+}
+
+/// Computes the dense rank of each string in UCA order among the given strings.
+///
+/// Strings, which collate equal, share a rank. The ranks are only comparable
+/// with the ranks of the same call, they cannot be stored and compared later.
+///
+/// # Arguments
+///
+/// * `inputs` - A vector of strings.
+/// * `parallel_threshold` - The number of distinct strings from which on they are sorted in parallel.
+///
+/// # Returns
+///
+/// A `PyResult` containing the rank of each string.
+///
+#[pyfunction]
+#[pyo3(signature = (inputs, parallel_threshold=None))]
+fn uca_ranks(
+    py: Python<'_>,
+    inputs: Vec<String>,
+    parallel_threshold: Option<usize>,
+) -> PyResult<Vec<u32>> {
+    let threshold = parallel_threshold.unwrap_or(collation::PARALLEL_THRESHOLD);
+    Ok(py.allow_threads(|| collation::ranks(&inputs, &Options::default(), threshold)))
 }
 
 /// Sorts a list of Python objects using the Unicode Collation Algorithm.
 ///
+/// The GIL is released while collating, above the `parallel_threshold`
+/// the strings are sorted on all cores.
+///
 /// # Arguments
 ///
 /// * `objects` - A vector of Python objects to be sorted.
 /// * `method_name` - The name of the method to call on each object to retrieve the string for comparison.
 /// * `args` - Optional arguments to pass to the method.
+/// * `parallel_threshold` - The number of distinct strings from which on they are sorted in parallel.
 ///
 /// # Returns
 ///
@@ -40,42 +89,662 @@ fn uca_simple_sort(mut inputs: Vec<String>) -> PyResult<Vec<String>> {
 /// This function will return an error if the collation process fails or if the method call on the Python objects fails.
 ///
 #[pyfunction]
-#[pyo3(signature = (objects, method_name, args=None))]
+#[pyo3(signature = (objects, method_name, args=None, parallel_threshold=None))]
 fn uca_complex_sort(
+    py: Python<'_>,
     objects: Vec<Py<PyAny>>,
     method_name: &str,
     args: Option<Vec<Py<PyAny>>>,
+    parallel_threshold: Option<usize>,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let threshold = parallel_threshold.unwrap_or(collation::PARALLEL_THRESHOLD);
+    let keys = objects
+        .iter()
+        .map(|obj| -> PyResult<String> {
+            let value = match &args {
+                Some(args) => {
+                    obj.call_method1(py, method_name, PyTuple::new(py, args.as_slice())?)?
+                }
+                None => obj.call_method0(py, method_name)?,
+            };
+            value.extract(py)
+        })
+        .collect::<PyResult<Vec<String>>>()?;
+
+    let ranks = py.allow_threads(|| collation::ranks(&keys, &Options::default(), threshold));
+    Ok(collation::sort_by_ranks(ranks, objects, false, false))
+}
+
+/// Sorts the items of an iterable using the Unicode Collation Algorithm, like Python's `sorted`.
+///
+/// The key function is called exactly once per item and the GIL is released
+/// while collating. Items with equal keys keep their order if `stable` is set,
+/// also when sorting in `reverse` order.
+///
+/// # Arguments
+///
+/// * `iterable` - Any iterable, it is consumed without creating an intermediate list.
+/// * `key` - A function returning the string to sort an item by, the items themselves are used if omitted.
+/// * `reverse` - Whether to sort in descending order.
+/// * `stable` - Whether to keep the order of items with equal keys.
+/// * `parallel_threshold` - The number of distinct keys from which on they are sorted in parallel.
+///
+/// # Returns
+///
+/// A `PyResult` containing a vector of the sorted items.
+///
+/// # Errors
+///
+/// This function will return an error if iterating, calling the key function or
+/// converting a key into a string fails.
+///
+#[pyfunction]
+#[pyo3(signature = (iterable, *, key=None, reverse=false, stable=true, parallel_threshold=None))]
+fn uca_sort(
+    py: Python<'_>,
+    iterable: &Bound<'_, PyAny>,
+    key: Option<Bound<'_, PyAny>>,
+    reverse: bool,
+    stable: bool,
+    parallel_threshold: Option<usize>,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let threshold = parallel_threshold.unwrap_or(collation::PARALLEL_THRESHOLD);
+    sort_iterable(
+        py,
+        iterable,
+        key,
+        reverse,
+        stable,
+        &Options::default(),
+        threshold,
+    )
+}
+
+/// Extracts the items of an iterable and the string to sort each of them by.
+fn extract_keyed(
+    iterable: &Bound<'_, PyAny>,
+    key: Option<&Bound<'_, PyAny>>,
+) -> PyResult<(Vec<Py<PyAny>>, Vec<String>)> {
+    let mut items: Vec<Py<PyAny>> = Vec::new();
+    let mut keys: Vec<String> = Vec::new();
+
+    for item in iterable.try_iter()? {
+        let item = item?;
+        keys.push(extract_key(&item, key)?);
+        items.push(item.unbind());
+    }
+    Ok((items, keys))
+}
+
+fn sort_iterable(
+    py: Python<'_>,
+    iterable: &Bound<'_, PyAny>,
+    key: Option<Bound<'_, PyAny>>,
+    reverse: bool,
+    stable: bool,
+    options: &Options,
+    threshold: usize,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let (items, keys) = extract_keyed(iterable, key.as_ref())?;
+    let ranks = py.allow_threads(|| collation::ranks(&keys, options, threshold));
+    Ok(collation::sort_by_ranks(ranks, items, reverse, stable))
+}
+
+/// Extracts the string to sort an item by.
+fn extract_key(item: &Bound<'_, PyAny>, key: Option<&Bound<'_, PyAny>>) -> PyResult<String> {
+    match key {
+        Some(key) => key.call1((item.clone(),))?.extract(),
+        None => item.extract(),
+    }
+}
+
+/// Finds the insertion point of `x` in the sorted sequence `a` with O(log n) comparisons.
+///
+/// Works like `bisect.bisect_left` / `bisect.bisect_right`, the key
+/// function is only applied to the items of `a`.
+///
+fn bisect(
+    a: &Bound<'_, PyAny>,
+    x: &str,
+    lo: usize,
+    hi: Option<usize>,
+    key: Option<&Bound<'_, PyAny>>,
+    options: &Options,
+    right: bool,
+) -> PyResult<usize> {
+    let mut lo = lo;
+    let mut hi = match hi {
+        Some(hi) => hi,
+        None => a.len()?,
+    };
+    while lo < hi {
+        let mid = lo + (hi - lo) / 2;
+        let value = extract_key(&a.get_item(mid)?, key)?;
+        let ordering = collation::compare(&value, x, options);
+        if ordering == Ordering::Less || (right && ordering == Ordering::Equal) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    Ok(lo)
+}
+
+/// Inserts `x` into the sorted list `a` after any equal items, see `bisect.insort`.
+fn insort(
+    a: &Bound<'_, PyAny>,
+    x: &Bound<'_, PyAny>,
+    lo: usize,
+    hi: Option<usize>,
+    key: Option<&Bound<'_, PyAny>>,
+    options: &Options,
+) -> PyResult<usize> {
+    let i = bisect(a, &extract_key(x, key)?, lo, hi, key, options, true)?;
+    a.call_method1("insert", (i, x.clone()))?;
+    Ok(i)
+}
+
+/// Finds the items of the sorted sequence `a` starting with `prefix` on the primary level.
+///
+/// The bounds are searched with (approximated, see `Strength`) primary strength,
+/// which is consistent with the order of `a` for every strength, except for
+/// strings which differ only beyond accents and case, e.g. in width variants.
+/// The upper bound is `prefix` followed
+/// by U+FFFF, which has the highest primary weight of all characters.
+///
+fn prefix_range(
+    a: &Bound<'_, PyAny>,
+    prefix: &str,
+    key: Option<&Bound<'_, PyAny>>,
+    options: &Options,
+) -> PyResult<(usize, usize)> {
+    let primary = Options {
+        strength: Strength::Primary,
+        ..*options
+    };
+    let lo = bisect(a, prefix, 0, None, key, &primary, false)?;
+    let hi = bisect(
+        a,
+        &format!("{prefix}\u{FFFF}"),
+        lo,
+        None,
+        key,
+        &primary,
+        false,
+    )?;
+    Ok((lo, hi))
+}
+
+/// Finds the leftmost insertion point of `x` in a UCA-sorted sequence, like `bisect.bisect_left`.
+///
+/// # Arguments
+///
+/// * `a` - A sequence sorted with the default collation, e.g. by `uca_sort`.
+/// * `x` - The string to search for.
+/// * `lo` - The first index to consider.
+/// * `hi` - The index after the last one to consider, the length of `a` if omitted.
+/// * `key` - A function returning the string of an item of `a`.
+///
+/// # Returns
+///
+/// A `PyResult` containing the index.
+///
+#[pyfunction]
+#[pyo3(signature = (a, x, lo=0, hi=None, *, key=None))]
+fn uca_bisect_left(
+    a: &Bound<'_, PyAny>,
+    x: &str,
+    lo: usize,
+    hi: Option<usize>,
+    key: Option<Bound<'_, PyAny>>,
+) -> PyResult<usize> {
+    bisect(a, x, lo, hi, key.as_ref(), &Options::default(), false)
+}
+
+/// Finds the rightmost insertion point of `x` in a UCA-sorted sequence, like `bisect.bisect_right`.
+///
+/// See `uca_bisect_left` for the arguments.
+///
+#[pyfunction]
+#[pyo3(signature = (a, x, lo=0, hi=None, *, key=None))]
+fn uca_bisect_right(
+    a: &Bound<'_, PyAny>,
+    x: &str,
+    lo: usize,
+    hi: Option<usize>,
+    key: Option<Bound<'_, PyAny>>,
+) -> PyResult<usize> {
+    bisect(a, x, lo, hi, key.as_ref(), &Options::default(), true)
+}
+
+/// Inserts an item into a UCA-sorted list, like `bisect.insort`.
+///
+/// # Arguments
+///
+/// * `a` - A list sorted with the default collation.
+/// * `x` - The item to insert, after any equal items.
+/// * `lo` - The first index to consider.
+/// * `hi` - The index after the last one to consider, the length of `a` if omitted.
+/// * `key` - A function returning the string of an item, applied to `x` as well.
+///
+/// # Returns
+///
+/// A `PyResult` containing the index of the inserted item.
+///
+#[pyfunction]
+#[pyo3(signature = (a, x, lo=0, hi=None, *, key=None))]
+fn uca_insort(
+    a: &Bound<'_, PyAny>,
+    x: &Bound<'_, PyAny>,
+    lo: usize,
+    hi: Option<usize>,
+    key: Option<Bound<'_, PyAny>>,
+) -> PyResult<usize> {
+    insort(a, x, lo, hi, key.as_ref(), &Options::default())
+}
+
+/// Finds all items of a UCA-sorted sequence, which start with a prefix.
+///
+/// The prefix is matched on the primary level, so "Zür" finds "Zürich"
+/// as well as "Zurich" and "zürcher".
+///
+/// # Arguments
+///
+/// * `a` - A sequence sorted with the default collation.
+/// * `prefix` - The prefix.
+/// * `key` - A function returning the string of an item of `a`.
+///
+/// # Returns
+///
+/// A `PyResult` containing the bounds `lo` and `hi` of the matching items `a[lo:hi]`.
+///
+#[pyfunction]
+#[pyo3(signature = (a, prefix, *, key=None))]
+fn uca_prefix_range(
+    a: &Bound<'_, PyAny>,
+    prefix: &str,
+    key: Option<Bound<'_, PyAny>>,
+) -> PyResult<(usize, usize)> {
+    prefix_range(a, prefix, key.as_ref(), &Options::default())
+}
+
+/// Parses the name of a strength, e.g. "primary".
+fn parse_strength(strength: &str) -> PyResult<Strength> {
+    match strength {
+        "primary" => Ok(Strength::Primary),
+        "secondary" => Ok(Strength::Secondary),
+        "tertiary" => Ok(Strength::Tertiary),
+        "identical" => Ok(Strength::Identical),
+        _ => Err(PyValueError::new_err(format!(
+            "Unknown strength {strength}, expected 'primary', 'secondary', 'tertiary' or 'identical'"
+        ))),
+    }
+}
+
+fn top_k(
+    py: Python<'_>,
+    iterable: &Bound<'_, PyAny>,
+    k: usize,
+    key: Option<Bound<'_, PyAny>>,
+    reverse: bool,
+    options: &Options,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let (items, keys) = extract_keyed(iterable, key.as_ref())?;
+    let selected = py.allow_threads(|| collation::top_k(&keys, k, options, reverse));
+    Ok(selected
+        .into_iter()
+        .map(|i| items[i].clone_ref(py))
+        .collect())
+}
+
+fn unique(
+    py: Python<'_>,
+    iterable: &Bound<'_, PyAny>,
+    key: Option<Bound<'_, PyAny>>,
+    options: &Options,
+    threshold: usize,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let (items, keys) = extract_keyed(iterable, key.as_ref())?;
+    let selected = py.allow_threads(|| collation::unique(&keys, options, threshold));
+    Ok(selected
+        .into_iter()
+        .map(|i| items[i].clone_ref(py))
+        .collect())
+}
+
+/// Selects the first `k` items of an iterable in UCA order.
+///
+/// Uses a partial sort, which is considerably faster than sorting all items
+/// for a small `k`. The result equals `uca_sort(iterable, key=key, reverse=reverse)[:k]`.
+///
+/// # Arguments
+///
+/// * `iterable` - Any iterable.
+/// * `k` - The number of items to select.
+/// * `key` - A function returning the string to sort an item by, the items themselves are used if omitted.
+/// * `reverse` - Whether to select the last items in UCA order instead.
+///
+/// # Returns
+///
+/// A `PyResult` containing the selected items in their order.
+///
+#[pyfunction]
+#[pyo3(signature = (iterable, k, *, key=None, reverse=false))]
+fn uca_top_k(
+    py: Python<'_>,
+    iterable: &Bound<'_, PyAny>,
+    k: usize,
+    key: Option<Bound<'_, PyAny>>,
+    reverse: bool,
+) -> PyResult<Vec<Py<PyAny>>> {
+    top_k(py, iterable, k, key, reverse, &Options::default())
+}
+
+/// Sorts the items of an iterable and drops the items, which are equal with the given strength.
+///
+/// Of each group of equal items, the first one is kept.
+///
+/// # Arguments
+///
+/// * `iterable` - Any iterable.
+/// * `key` - A function returning the string to sort an item by, the items themselves are used if omitted.
+/// * `strength` - The strength, e.g. "primary" to treat "Zürich" and "Zurich" as equal, see `Strength` for its limits.
+/// * `parallel_threshold` - The number of distinct keys from which on they are sorted in parallel.
+///
+/// # Returns
+///
+/// A `PyResult` containing the distinct items in UCA order.
+///
+/// # Errors
+///
+/// This function will return an error for an unknown strength.
+///
+#[pyfunction]
+#[pyo3(signature = (iterable, *, key=None, strength="identical", parallel_threshold=None))]
+fn uca_unique(
+    py: Python<'_>,
+    iterable: &Bound<'_, PyAny>,
+    key: Option<Bound<'_, PyAny>>,
+    strength: &str,
+    parallel_threshold: Option<usize>,
 ) -> PyResult<Vec<Py<PyAny>>> {
-    let mut collator = Collator::default();
-    let mut values: Vec<(String, Py<PyAny>)> = Python::with_gil(|py| {
-        objects
+    let options = Options {
+        strength: parse_strength(strength)?,
+        ..Options::default()
+    };
+    let threshold = parallel_threshold.unwrap_or(collation::PARALLEL_THRESHOLD);
+    unique(py, iterable, key, &options, threshold)
+}
+
+/// A configured UCA collator, which can be shared between threads.
+///
+/// The underlying collation tables are set up once per thread and options,
+/// so all later calls with the same options reuse them. Primary and secondary
+/// strength are approximations, see `Strength`.
+///
+#[pyclass(frozen, module = "ssrq_utils.uca", name = "Collator")]
+struct PyCollator {
+    options: Options,
+    parallel_threshold: usize,
+}
+
+#[pymethods]
+impl PyCollator {
+    #[new]
+    #[pyo3(signature = (*, tailoring="cldr", shifting=true, strength="identical", parallel_threshold=None))]
+    fn new(
+        tailoring: &str,
+        shifting: bool,
+        strength: &str,
+        parallel_threshold: Option<usize>,
+    ) -> PyResult<Self> {
+        let table = match tailoring {
+            "cldr" => Table::Cldr,
+            "ducet" => Table::Ducet,
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "Unknown tailoring {tailoring}, expected 'cldr' or 'ducet'"
+                )))
+            }
+        };
+        Ok(Self {
+            options: Options {
+                table,
+                shifting,
+                strength: parse_strength(strength)?,
+            },
+            parallel_threshold: parallel_threshold.unwrap_or(collation::PARALLEL_THRESHOLD),
+        })
+    }
+
+    #[getter]
+    fn tailoring(&self) -> &'static str {
+        match self.options.table {
+            Table::Cldr => "cldr",
+            Table::Ducet => "ducet",
+        }
+    }
+
+    #[getter]
+    fn shifting(&self) -> bool {
+        self.options.shifting
+    }
+
+    #[getter]
+    fn strength(&self) -> &'static str {
+        match self.options.strength {
+            Strength::Primary => "primary",
+            Strength::Secondary => "secondary",
+            Strength::Tertiary => "tertiary",
+            Strength::Identical => "identical",
+        }
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "Collator(tailoring='{}', shifting={}, strength='{}')",
+            self.tailoring(),
+            if self.options.shifting {
+                "True"
+            } else {
+                "False"
+            },
+            self.strength()
+        )
+    }
+
+    /// Sorts the items of an iterable, see `uca_sort`.
+    #[pyo3(signature = (iterable, *, key=None, reverse=false, stable=true))]
+    fn sort(
+        &self,
+        py: Python<'_>,
+        iterable: &Bound<'_, PyAny>,
+        key: Option<Bound<'_, PyAny>>,
+        reverse: bool,
+        stable: bool,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        sort_iterable(
+            py,
+            iterable,
+            key,
+            reverse,
+            stable,
+            &self.options,
+            self.parallel_threshold,
+        )
+    }
+
+    /// Selects the first `k` items in UCA order, see `uca_top_k`.
+    #[pyo3(signature = (iterable, k, *, key=None, reverse=false))]
+    fn top_k(
+        &self,
+        py: Python<'_>,
+        iterable: &Bound<'_, PyAny>,
+        k: usize,
+        key: Option<Bound<'_, PyAny>>,
+        reverse: bool,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        top_k(py, iterable, k, key, reverse, &self.options)
+    }
+
+    /// Sorts the items and drops the items, which are equal with the strength of the collator.
+    #[pyo3(signature = (iterable, *, key=None))]
+    fn unique(
+        &self,
+        py: Python<'_>,
+        iterable: &Bound<'_, PyAny>,
+        key: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        unique(py, iterable, key, &self.options, self.parallel_threshold)
+    }
+
+    /// Compares two strings, returns -1, 0 or 1.
+    fn compare(&self, a: &str, b: &str) -> i8 {
+        match collation::compare(a, b, &self.options) {
+            Ordering::Less => -1,
+            Ordering::Equal => 0,
+            Ordering::Greater => 1,
+        }
+    }
+
+    /// Wraps a string in a key, which compares with the keys of other strings by collating them.
+    fn sort_key(&self, value: String) -> SortKey {
+        SortKey {
+            value,
+            options: self.options,
+        }
+    }
+
+    /// Computes the dense rank of each string, see `uca_ranks`.
+    fn ranks(&self, py: Python<'_>, inputs: Vec<String>) -> Vec<u32> {
+        py.allow_threads(|| collation::ranks(&inputs, &self.options, self.parallel_threshold))
+    }
+
+    /// Finds the leftmost insertion point of `x`, see `uca_bisect_left`.
+    #[pyo3(signature = (a, x, lo=0, hi=None, *, key=None))]
+    fn bisect_left(
+        &self,
+        a: &Bound<'_, PyAny>,
+        x: &str,
+        lo: usize,
+        hi: Option<usize>,
+        key: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<usize> {
+        bisect(a, x, lo, hi, key.as_ref(), &self.options, false)
+    }
+
+    /// Finds the rightmost insertion point of `x`, see `uca_bisect_right`.
+    #[pyo3(signature = (a, x, lo=0, hi=None, *, key=None))]
+    fn bisect_right(
+        &self,
+        a: &Bound<'_, PyAny>,
+        x: &str,
+        lo: usize,
+        hi: Option<usize>,
+        key: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<usize> {
+        bisect(a, x, lo, hi, key.as_ref(), &self.options, true)
+    }
+
+    /// Inserts an item into a sorted list, see `uca_insort`.
+    #[pyo3(signature = (a, x, lo=0, hi=None, *, key=None))]
+    fn insort(
+        &self,
+        a: &Bound<'_, PyAny>,
+        x: &Bound<'_, PyAny>,
+        lo: usize,
+        hi: Option<usize>,
+        key: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<usize> {
+        insort(a, x, lo, hi, key.as_ref(), &self.options)
+    }
+
+    /// Finds the bounds of the items starting with a prefix, see `uca_prefix_range`.
+    #[pyo3(signature = (a, prefix, *, key=None))]
+    fn prefix_range(
+        &self,
+        a: &Bound<'_, PyAny>,
+        prefix: &str,
+        key: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<(usize, usize)> {
+        prefix_range(a, prefix, key.as_ref(), &self.options)
+    }
+
+    /// Lazily merges sorted iterables, see `uca_merge`.
+    #[pyo3(signature = (*iterables, key=None, reverse=false))]
+    fn merge(
+        &self,
+        iterables: &Bound<'_, PyTuple>,
+        key: Option<Bound<'_, PyAny>>,
+        reverse: bool,
+    ) -> PyResult<merge::UcaMerge> {
+        merge::UcaMerge::new(iterables, key, self.options, reverse)
+    }
+
+    /// Merges two sorted iterables into a sorted list, items of `left` come first on ties.
+    #[pyo3(signature = (left, right, *, key=None))]
+    fn sorted_merge(
+        &self,
+        py: Python<'_>,
+        left: &Bound<'_, PyAny>,
+        right: &Bound<'_, PyAny>,
+        key: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        let (left_items, left_keys) = extract_keyed(left, key.as_ref())?;
+        let (right_items, right_keys) = extract_keyed(right, key.as_ref())?;
+        let order =
+            py.allow_threads(|| collation::merge_order(&left_keys, &right_keys, &self.options));
+
+        let (mut left_items, mut right_items) = (left_items.into_iter(), right_items.into_iter());
+        Ok(order
             .into_iter()
-            .map(|obj| {
-                let value: String = match &args {
-                    Some(args) => obj
-                        .call_method1(py, method_name, PyTuple::new(py, args.as_slice()).unwrap())
-                        .unwrap()
-                        .extract(py)
-                        .unwrap(),
-                    None => obj
-                        .call_method0(py, method_name)
-                        .unwrap()
-                        .extract(py)
-                        .unwrap(),
-                };
-                (value, obj)
+            .filter_map(|take_left| {
+                if take_left {
+                    left_items.next()
+                } else {
+                    right_items.next()
+                }
             })
-            .collect()
-    });
+            .collect())
+    }
+}
+
+/// A string, which compares with other keys of the same collator by collating.
+#[pyclass(frozen, module = "ssrq_utils.uca")]
+struct SortKey {
+    value: String,
+    options: Options,
+}
+
+#[pymethods]
+impl SortKey {
+    fn __richcmp__(&self, other: &Self, op: CompareOp) -> bool {
+        op.matches(collation::compare(&self.value, &other.value, &self.options))
+    }
 
-    values.sort_unstable_by(|a, b| collator.collate(&a.0, &b.0));
-    Ok(values.into_iter().map(|(_, obj)| obj).collect())
+    fn __repr__(&self) -> String {
+        format!("SortKey({:?})", self.value)
+    }
 }
 
 /// A Python module implemented in Rust.
 #[pymodule]
 fn _pyferuca(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<PyCollator>()?;
+    m.add_class::<SortKey>()?;
+    m.add_class::<merge::UcaMerge>()?;
     m.add_function(wrap_pyfunction!(uca_simple_sort, m)?)?;
     m.add_function(wrap_pyfunction!(uca_complex_sort, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_sort, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_ranks, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_bisect_left, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_bisect_right, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_insort, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_prefix_range, m)?)?;
+    m.add_function(wrap_pyfunction!(merge::uca_merge, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_top_k, m)?)?;
+    m.add_function(wrap_pyfunction!(uca_unique, m)?)?;
+    m.add_function(wrap_pyfunction!(idno::parse_idno, m)?)?;
+    m.add_function(wrap_pyfunction!(idno::parse_idnos, m)?)?;
     Ok(())
 }
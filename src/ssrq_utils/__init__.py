@@ -1,3 +1,10 @@
-from ssrq_utils import idno, urn
+from typing import TYPE_CHECKING
+
+from ssrq_utils._lazy import attach
+
+if TYPE_CHECKING:
+    from ssrq_utils import idno, urn
 
 __all__ = ["idno", "urn"]
+
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -0,0 +1,173 @@
+import mmap
+import struct
+import sys
+
+from ssrq_utils.idno.index import AnyIDNO
+from ssrq_utils.idno.model import IDNOFields
+
+VERSION = 1
+
+# magic, version, number of strings and number of records
+_HEADER = struct.Struct("<8sIII")
+
+# flags marking the optional fields present in a record, they fit into one byte
+_CASE = 1
+_OPENING = 2
+_DOC = 4
+_NUM = 8
+_SPECIAL = 16
+# only used by `ssrq_utils.urn.codec`
+_FRAGMENT = 32
+_MODEL = 64
+
+# varints store 7 bits per byte, the high bit marks that more bytes follow
+_CONTINUATION = 0x80
+
+_CORRUPT = "The given buffer is truncated or corrupt"
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError(f"Only non-negative numbers can be encoded, got {value}")
+    while value >= _CONTINUATION:
+        out.append(value & 0x7F | _CONTINUATION)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: memoryview, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < _CONTINUATION:
+            return value, pos
+        shift += 7
+
+
+class _Encoder:
+    """Collects the records and the string table of a buffer."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.records = bytearray()
+        self.count = 0
+
+    def string(self, value: str) -> None:
+        if (index := self.strings.get(value)) is None:
+            index = self.strings[value] = len(self.strings)
+        _write_varint(self.records, index)
+
+    def add(self, idno: AnyIDNO, flags: int = 0, fragment: str | None = None) -> None:
+        """Add a record with the fields of an IDNO."""
+        case, opening, doc, num, special = idno.case, idno.opening, idno.doc, idno.num, idno.special
+        flags |= (
+            (case is not None and _CASE)
+            | (opening is not None and _OPENING)
+            | (doc is not None and _DOC)
+            | (num is not None and _NUM)
+            | (special is not None and _SPECIAL)
+            | (fragment is not None and _FRAGMENT)
+        )
+        self.records.append(flags)
+        self.string(idno.prefix)
+        self.string(idno.kanton)
+        self.string(idno.volume)
+        if case is not None:
+            _write_varint(self.records, case)
+        if opening is not None:
+            self.string(opening)
+        if doc is not None:
+            _write_varint(self.records, doc)
+        if num is not None:
+            _write_varint(self.records, num)
+        if special is not None:
+            self.string(special)
+        if fragment is not None:
+            self.string(fragment)
+        self.count += 1
+
+    def add_string(self, idno: str, fragment: str | None = None) -> None:
+        """Add a record with an IDNO stored verbatim, i.e. without the `_MODEL` flag."""
+        self.records.append(_FRAGMENT if fragment is not None else 0)
+        self.string(idno)
+        if fragment is not None:
+            self.string(fragment)
+        self.count += 1
+
+    def build(self, magic: bytes) -> bytes:
+        table = bytearray()
+        for value in self.strings:
+            data = value.encode()
+            _write_varint(table, len(data))
+            table.extend(data)
+        return b"".join(
+            [_HEADER.pack(magic, VERSION, len(self.strings), self.count), table, self.records]
+        )
+
+
+def _decode(buffer: Buffer, magic: bytes) -> tuple[memoryview, int, int, list[str]]:
+    """Check the header and read the string table.
+
+    Returns the data, the position of the first record, the number of
+    records and the string table. The records are read on demand by the
+    codecs, see `_read_fields`.
+    """
+    data = memoryview(buffer).cast("B")
+    if len(data) < _HEADER.size:
+        raise ValueError("The given buffer is too short")
+    header_magic, version, size, count = _HEADER.unpack_from(data)
+    if header_magic != magic or version != VERSION:
+        raise ValueError("The given buffer was not created by this codec")
+
+    pos = _HEADER.size
+    strings: list[str] = []
+    try:
+        for _ in range(size):
+            length, pos = _read_varint(data, pos)
+            if pos + length > len(data):
+                raise IndexError
+            strings.append(sys.intern(str(data[pos : pos + length], "utf-8")))
+            pos += length
+    except (IndexError, UnicodeDecodeError):
+        raise ValueError(_CORRUPT) from None
+
+    return data, pos, count, strings
+
+
+def _read_fields(
+    data: memoryview, pos: int, flags: int, strings: list[str]
+) -> tuple[IDNOFields, int]:
+    """Read the fields of an IDNO at a position, returns them and the position after them.
+
+    Raises an `IndexError` if the buffer ends early or a string is not in the table.
+    """
+    prefix, pos = _read_varint(data, pos)
+    kanton, pos = _read_varint(data, pos)
+    volume, pos = _read_varint(data, pos)
+    case = opening = doc = num = special = None
+    if flags & _CASE:
+        case, pos = _read_varint(data, pos)
+    if flags & _OPENING:
+        index, pos = _read_varint(data, pos)
+        opening = strings[index]
+    if flags & _DOC:
+        doc, pos = _read_varint(data, pos)
+    if flags & _NUM:
+        num, pos = _read_varint(data, pos)
+    if flags & _SPECIAL:
+        index, pos = _read_varint(data, pos)
+        special = strings[index]
+    return (
+        strings[prefix],
+        strings[kanton],
+        strings[volume],
+        case,
+        opening,
+        doc,
+        num,
+        special,
+    ), pos
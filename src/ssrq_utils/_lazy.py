@@ -0,0 +1,34 @@
+import importlib
+from collections.abc import Callable
+from types import ModuleType
+
+
+def attach(
+    package: str, submodules: list[str]
+) -> tuple[Callable[[str], ModuleType], Callable[[], list[str]]]:
+    """Create a module level `__getattr__` and `__dir__`, which import submodules on first access.
+
+    Importing a package should not pay for all of its submodules, e.g. a
+    script using `ssrq_utils.lang` does not need pydantic. Once imported,
+    a submodule is an attribute of its package and `__getattr__` is not
+    called again.
+
+    Args:
+        package (str): The name of the package, i.e. `__name__`.
+        submodules (list[str]): The names of the submodules to load lazily.
+
+    Returns:
+        tuple[Callable[[str], ModuleType], Callable[[], list[str]]]: `__getattr__` and `__dir__`.
+
+    """
+    names = frozenset(submodules)
+
+    def __getattr__(name: str) -> ModuleType:  # noqa: N807
+        if name in names:
+            return importlib.import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(names | set(vars(importlib.import_module(package))))
+
+    return __getattr__, __dir__
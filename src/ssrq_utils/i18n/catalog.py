@@ -0,0 +1,224 @@
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+from ssrq_utils.i18n.error import I18nValidationError
+from ssrq_utils.i18n.model import I18nMap
+
+MAGIC = b"SSRQI18N"
+VERSION = 2
+LANGUAGES = tuple(I18nMap.model_fields)
+
+# magic, version, number of keys and size of the string table
+_HEADER = struct.Struct("<8sIII")
+# offset and length of a string in the string table
+_ENTRY = struct.Struct("<II")
+# a slot of the hash table of the keys, the position of a key plus one, 0 if empty
+_SLOT = struct.Struct("<I")
+
+
+def _slots(size: int) -> int:
+    """Get the number of slots of the hash table, a power of two at least twice the keys."""
+    return 1 << (2 * size).bit_length()
+
+
+def _hash(key: bytes) -> int:
+    # unlike `hash`, CRC-32 does not change between processes
+    return zlib.crc32(key)
+
+
+def build_catalog(translations: I18nMap) -> bytes:
+    """Build a binary catalog from validated translations.
+
+    The catalog consists of a header, the entries of the sorted keys,
+    the entries of the values per language (in the order of the keys),
+    a hash table of the keys with linear probing and a string table.
+    Equal strings are only stored once.
+
+    Args:
+        translations (I18nMap): The translations.
+
+    Returns:
+        bytes: The catalog.
+
+    """
+    keys = sorted(translations.de)
+    table = bytearray()
+    interned: dict[str, bytes] = {}
+
+    def intern(value: str) -> bytes:
+        if (entry := interned.get(value)) is None:
+            data = value.encode()
+            entry = interned[value] = _ENTRY.pack(len(table), len(data))
+            table.extend(data)
+        return entry
+
+    entries = [intern(key) for key in keys]
+    for lang in LANGUAGES:
+        column: dict[str, str] = getattr(translations, lang)
+        entries.extend(intern(column[key]) for key in keys)
+
+    slots = [0] * _slots(len(keys))
+    mask = len(slots) - 1
+    for index, key in enumerate(keys):
+        slot = _hash(key.encode()) & mask
+        while slots[slot]:
+            slot = slot + 1 & mask
+        slots[slot] = index + 1
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, len(keys), len(table)),
+            *entries,
+            struct.pack(f"<{len(slots)}I", *slots),
+            table,
+        ]
+    )
+
+
+def compile_catalog(source: Path, target: Path) -> None:
+    """Compile a JSON file with translations into a binary catalog.
+
+    The translations are validated with `I18nMap` once while compiling,
+    the target is replaced atomically.
+
+    Args:
+        source (Path): The JSON file.
+        target (Path): The path of the catalog.
+
+    Raises:
+        ValueError: If the translations are not valid.
+
+    """
+    with open(source) as f:
+        catalog = build_catalog(I18nMap.model_validate_json(f.read()))
+
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_bytes(catalog)
+    os.replace(tmp, target)
+
+
+def is_catalog(path: Path) -> bool:
+    """Check if a file is a binary catalog."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CatalogView(Mapping[str, str]):
+    """The read-only translations of a single language in a `Catalog`."""
+
+    def __init__(self, catalog: "Catalog", lang: str) -> None:  # noqa: D107
+        self._catalog = catalog
+        self._column = LANGUAGES.index(lang) + 1
+
+    def __getitem__(self, key: str) -> str:  # noqa: D105
+        if (index := self._catalog.index(key)) < 0:
+            raise KeyError(key)
+        return self._catalog.string(self._column, index)
+
+    def __iter__(self) -> Iterator[str]:  # noqa: D105
+        return (self._catalog.string(0, index) for index in range(len(self._catalog)))
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._catalog)
+
+
+class Catalog:
+    """Translations in a binary catalog, see `compile_catalog`.
+
+    Opening a catalog maps the file into memory and checks its header,
+    including that the file is as large as the header states. Nothing is
+    parsed or validated otherwise and processes using the same catalog
+    share its pages. Keys are looked up in the hash table of the catalog,
+    which takes about 2 µs, several times a dict lookup.
+
+    Args:
+        buffer (bytes | mmap.mmap): The content of the catalog.
+
+    Raises:
+        I18nValidationError: If the buffer is not a catalog of a supported version
+            or if it is truncated.
+
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:  # noqa: D107
+        if len(buffer) < _HEADER.size:
+            raise I18nValidationError("The given file is not a translation catalog")
+        magic, version, size, table = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise I18nValidationError("The given file is not a translation catalog")
+        slots = _HEADER.size + _ENTRY.size * size * (len(LANGUAGES) + 1)
+        strings = slots + _SLOT.size * _slots(size)
+        if len(buffer) < strings + table:
+            raise I18nValidationError("The translation catalog is truncated")
+        self._buffer = buffer
+        self._size: int = size
+        self._slots = slots
+        self._mask = _slots(size) - 1
+        self._strings = strings
+
+    @classmethod
+    def open(cls, path: Path) -> "Catalog":
+        """Memory-map a catalog file.
+
+        Args:
+            path (Path): The path of the catalog.
+
+        Returns:
+            Catalog: The catalog.
+
+        """
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:  # noqa: D105
+        return self._size
+
+    def _bytes(self, column: int, index: int) -> bytes:
+        offset, length = _ENTRY.unpack_from(
+            self._buffer, _HEADER.size + _ENTRY.size * (column * self._size + index)
+        )
+        start = self._strings + offset
+        return self._buffer[start : start + length]
+
+    def string(self, column: int, index: int) -> str:
+        """Get a string of the catalog.
+
+        Args:
+            column (int): `0` for the keys, otherwise the position of the language plus one.
+            index (int): The position of the key.
+
+        Returns:
+            str: The string.
+
+        """
+        return self._bytes(column, index).decode()
+
+    def index(self, key: str) -> int:
+        """Get the position of a key, `-1` if the catalog does not contain it."""
+        encoded = key.encode()
+        slot = _hash(encoded) & self._mask
+        while index := _SLOT.unpack_from(self._buffer, self._slots + _SLOT.size * slot)[0]:
+            if self._bytes(0, index - 1) == encoded:
+                return index - 1
+            slot = slot + 1 & self._mask
+        return -1
+
+    @property
+    def de(self) -> CatalogView:  # noqa: D102
+        return CatalogView(self, "de")
+
+    @property
+    def en(self) -> CatalogView:  # noqa: D102
+        return CatalogView(self, "en")
+
+    @property
+    def fr(self) -> CatalogView:  # noqa: D102
+        return CatalogView(self, "fr")
+
+    @property
+    def it(self) -> CatalogView:  # noqa: D102
+        return CatalogView(self, "it")
@@ -1,9 +1,18 @@
-from typing import Self, cast
+from typing import Self
 
 from pydantic import BaseModel, Field, model_validator
 
 from ssrq_utils.i18n.error import I18nValidationError
 
+MAX_REPORTED_KEYS = 10
+
+
+def _format_keys(keys: set[str]) -> str:
+    reported = ", ".join(f"'{key}'" for key in sorted(keys)[:MAX_REPORTED_KEYS])
+    if len(keys) > MAX_REPORTED_KEYS:
+        reported += f" (and {len(keys) - MAX_REPORTED_KEYS} more)"
+    return reported
+
 
 class I18nMap(BaseModel):
     """A i18n map with translations for SSRQ display languages."""
@@ -15,17 +24,25 @@ class I18nMap(BaseModel):
 
     @model_validator(mode="after")
     def check_entries(self) -> Self:
-        """Check if the given translations are equals."""
-        lang_keys = self.model_dump().keys()
-        for lang in lang_keys:
-            defined_translations = cast(dict[str, str], getattr(self, lang)).keys()
-            if not all(
-                len(cast(dict[str, str], getattr(self, other_lang).keys()))
-                == len(defined_translations)
-                for other_lang in lang_keys
-                if other_lang != lang
-            ):
-                raise I18nValidationError(
-                    f"The given translations for »{lang}« are not equal to the translations of the other languages."
-                )
+        """Check if the given translations define the same keys.
+
+        The keys of each language are compared with the German ones
+        as set views, without copying them. All differences are
+        reported at once.
+        """
+        reference = self.de.keys()
+        problems = []
+        for lang in ("en", "fr", "it"):
+            keys = getattr(self, lang).keys()
+            if keys == reference:
+                continue
+            if missing := reference - keys:
+                problems.append(f"»{lang}« is missing the keys {_format_keys(missing)}")
+            if extra := keys - reference:
+                problems.append(f"»{lang}« has the additional keys {_format_keys(extra)}")
+
+        if problems:
+            raise I18nValidationError(
+                "The given translations are not equal to the German ones: " + "; ".join(problems)
+            )
         return self
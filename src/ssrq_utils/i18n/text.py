@@ -1,7 +1,14 @@
 import re
+from collections.abc import Iterable, Iterator
 
 from ssrq_utils.lang.display import Lang
 
+# matches the whitespace before a punctuation mark, or the empty string if there is none,
+# so that the marks can be normalized by a literal replacement without a callback per match
+PUNCTUATION_MARK_PATTERN = re.compile(r"(?<!\s)\s*(?=[:?;!])")
+
+_PUNCTUATION_MARK_SPACING = {Lang.FR: " "}
+
 
 def create_punctuation_mark(mark: str, lang: Lang) -> str:
     """Create a punctuation mark in the given language.
@@ -21,7 +28,7 @@ def create_punctuation_mark(mark: str, lang: Lang) -> str:
             return mark
 
 
-def normalize_punctuation_marks(text: str, lang: Lang):
+def normalize_punctuation_marks(text: str, lang: Lang) -> str:
     """Normalize punctuation marks in a string.
 
     Args:
@@ -32,6 +39,36 @@ def normalize_punctuation_marks(text: str, lang: Lang):
         str: The text with normalized punctuation marks.
 
     """
-    return re.sub(
-        r"\s*(:|\?|;|!)", lambda match: create_punctuation_mark(match.group(1), lang), text
-    )
+    return PUNCTUATION_MARK_PATTERN.sub(_PUNCTUATION_MARK_SPACING.get(lang, ""), text)
+
+
+def iter_normalized_punctuation_marks(chunks: Iterable[str], lang: Lang) -> Iterator[str]:
+    """Normalize punctuation marks in a text, which is given in chunks.
+
+    Works like `normalize_punctuation_marks`, without joining the chunks
+    e.g. the text nodes of a whole volume. One string is yielded per chunk,
+    the trailing whitespace of a chunk is moved to the next one, as it
+    could be followed by a punctuation mark.
+
+    Args:
+        chunks (Iterable[str]): The chunks of the text.
+        lang (Lang): The language.
+
+    Returns:
+        Iterator[str]: The normalized chunks, joining them gives the normalized text.
+
+    """
+    spacing = _PUNCTUATION_MARK_SPACING.get(lang, "")
+    pending = ""
+    previous: str | None = None
+
+    for chunk in chunks:
+        text = pending + chunk
+        body = text.rstrip()
+        pending = text[len(body) :]
+        if previous is not None:
+            yield previous
+        previous = PUNCTUATION_MARK_PATTERN.sub(spacing, body)
+
+    if previous is not None:
+        yield previous + pending
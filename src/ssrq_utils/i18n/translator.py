@@ -1,56 +1,220 @@
+import logging
+import os
 import threading
+from collections.abc import Iterable, Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar, NamedTuple
 
-import cachebox
-
+from ssrq_utils.i18n.catalog import Catalog, is_catalog
 from ssrq_utils.i18n.model import I18nMap
 from ssrq_utils.lang.display import Lang
 
+logger = logging.getLogger(__name__)
+
+# inode, modification time and size of a translation source
+FileStat = tuple[int, int, int]
+
+
+class _State(NamedTuple):
+    """The loaded translations of a Translator, they are replaced as a whole on reload."""
+
+    translations: I18nMap | Catalog
+    bundles: dict[Lang, Mapping[str, str]]
+    stat: FileStat
+
+
+def _bundles(translations: I18nMap | Catalog) -> dict[Lang, Mapping[str, str]]:
+    # the dicts of an I18nMap are wrapped without copying, a catalog is already read-only
+    return {
+        lang: (
+            MappingProxyType(bundle)
+            if isinstance(bundle := getattr(translations, lang.value), dict)
+            else bundle
+        )
+        for lang in Lang
+    }
+
+
+def _stat(source: Path) -> FileStat:
+    stat = os.stat(source)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
 
 class Translator:
     """A utility class to translate various
     values, which are stored in a JSON file. May be
     used to translate strings in the UI of the frontend.
-    Implemented as a singleton to avoid multiple
-    instances of the same translations.
+    Instances are shared per translation source to avoid
+    multiple instances of the same translations: creating
+    a Translator for an already loaded source returns the
+    existing instance, another source gets its own one.
+    Changed translations can be applied at runtime with
+    `reload` or `watch`.
 
     Args:
-        translation_source (Path): The path to the JSON file containing the translations.
+        translation_source (Path): The path to the JSON file containing the translations
+            or to a binary catalog compiled from it (see `i18n.catalog.compile_catalog`).
 
     Returns:
-        Translator: The singleton instance of the Translator class.
+        Translator: The shared instance for the translation source.
 
     """  # noqa: D205
 
-    _instance = None
+    _instances: ClassVar[dict[Path, "Translator"]] = {}
+    _namespaces: ClassVar[dict[str, Path]] = {}
     _lock = threading.Lock()
-    translations: I18nMap
+    _source: Path
+    _state: _State
+    _reload_lock: threading.Lock
+    _watcher: tuple[threading.Thread, threading.Event] | None
 
     def __new__(cls, translation_source: Path) -> "Translator":  # noqa: D102
-        if cls._instance is None:
+        source = Path(translation_source).resolve()
+        if (instance := cls._instances.get(source)) is None:
             with cls._lock:
-                cls._instance = super().__new__(cls)
-                cls._instance._load_translations(translation_source)
-        return cls._instance
+                # another thread may have loaded the source while waiting for the lock
+                if (instance := cls._instances.get(source)) is None:
+                    instance = super().__new__(cls)
+                    instance._source = source
+                    instance._state = instance._load_state()
+                    instance._reload_lock = threading.Lock()
+                    instance._watcher = None
+                    cls._instances[source] = instance
+        return instance
+
+    @classmethod
+    def register(cls, namespace: str, translation_source: Path) -> None:
+        """Register the translation source of a namespace, e.g. of a frontend.
 
-    def _load_translations(self, translation_source: Path) -> None:
-        """Load the translations from the given JSON file.
+        The translations are only loaded on the first call of `for_namespace`.
 
         Args:
-            translation_source (Path): The path to the JSON file containing the translations.
+            namespace (str): The name of the namespace.
+            translation_source (Path): The path to the JSON file or the catalog.
+
+        Raises:
+            ValueError: If the namespace is already registered with another source.
+
+        """
+        source = Path(translation_source).resolve()
+        with cls._lock:
+            if cls._namespaces.setdefault(namespace, source) != source:
+                raise ValueError(f"The namespace '{namespace}' is already registered")
+
+    @classmethod
+    def for_namespace(cls, namespace: str) -> "Translator":
+        """Get the Translator of a registered namespace, see `register`.
+
+        Args:
+            namespace (str): The name of the namespace.
+
+        Returns:
+            Translator: The shared instance for the source of the namespace.
+
+        Raises:
+            KeyError: If the namespace is not registered.
+
+        """
+        return cls(cls._namespaces[namespace])
+
+    @property
+    def translations(self) -> I18nMap | Catalog:
+        """The currently loaded translations."""
+        return self._state.translations
+
+    def _load_state(self) -> _State:
+        # stat before reading, so that a change while reading is detected by the next reload
+        stat = _stat(self._source)
+        translations = self._load_translations(self._source)
+        return _State(translations, _bundles(translations), stat)
+
+    def _load_translations(self, translation_source: Path) -> I18nMap | Catalog:
+        """Load the translations from the given JSON file or binary catalog.
+
+        A catalog is memory-mapped, it has already been validated when
+        compiling it.
+
+        Args:
+            translation_source (Path): The path to the JSON file or the catalog.
 
         Returns:
-            None
+            I18nMap | Catalog: The translations.
 
         Raises:
             ValueError: If the translations are not valid.
             See the I18nMap class for more information.
 
         """
+        if is_catalog(translation_source):
+            return Catalog.open(translation_source)
         with open(translation_source) as f:
-            self.translations = I18nMap.model_validate_json(f.read())
+            return I18nMap.model_validate_json(f.read())
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload the translations, if the translation source has changed.
+
+        A change is detected by the inode, modification time and size of
+        the file. The new translations are loaded and validated, before
+        they replace the current ones in a single step: concurrent calls
+        of `translate` are not blocked and use either the old or the new
+        translations. Bundles returned before keep the old translations.
+
+        Args:
+            force (bool): Reload even if no change has been detected.
+
+        Returns:
+            bool: True if the translations were reloaded.
+
+        Raises:
+            ValueError: If the new translations are not valid, the current ones are kept.
+
+        """
+        with self._reload_lock:
+            if not force and _stat(self._source) == self._state.stat:
+                return False
+            self._state = self._load_state()
+            return True
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Poll the translation source in a background thread and reload it on changes.
+
+        Errors while reloading are logged, the current translations are kept
+        until the source is valid again.
+
+        Args:
+            interval (float): The number of seconds between two checks.
+
+        """
+        with self._reload_lock:
+            if self._watcher is not None:
+                return
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self._poll,
+                args=(interval, stop),
+                name=f"Translator({self._source})",
+                daemon=True,
+            )
+            self._watcher = (thread, stop)
+        thread.start()
+
+    def unwatch(self) -> None:
+        """Stop polling the translation source, see `watch`."""
+        with self._reload_lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            thread, stop = watcher
+            stop.set()
+            thread.join()
+
+    def _poll(self, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Reloading the translations from %s failed", self._source)
 
-    @cachebox.cachedmethod(cachebox.LRUCache(maxsize=128))
     def translate(self, lang: Lang, key: str) -> str:
         """Tranlates the given key to the given language.
 
@@ -64,11 +228,39 @@ class Translator:
             str: The translated value.
 
         """
-        match lang:
-            case Lang.DE | Lang.EN | Lang.FR | Lang.IT:
-                return self._get_translation_value(getattr(self.translations, lang.value), key)
-            case _:
-                return f"Unknown language: '{lang}'"
-
-    def _get_translation_value(self, data: dict[str, str], key: str) -> str:
-        return data.get(key, f"Unknown key: '{key}'")
+        if (bundle := self._state.bundles.get(lang)) is None:
+            return f"Unknown language: '{lang}'"
+        return bundle.get(key, f"Unknown key: '{key}'")
+
+    def translate_many(self, lang: Lang, keys: Iterable[str]) -> list[str]:
+        """Translate several keys to the given language at once.
+
+        Args:
+            lang (Lang): The language to translate to.
+            keys (Iterable[str]): The keys to translate.
+
+        Returns:
+            list[str]: The translated values in the order of the keys, see `translate`.
+
+        """
+        if (bundle := self._state.bundles.get(lang)) is None:
+            return [f"Unknown language: '{lang}'" for _ in keys]
+        return [bundle.get(key, f"Unknown key: '{key}'") for key in keys]
+
+    def bundle(self, lang: Lang) -> Mapping[str, str]:
+        """Get all translations of a language as a read-only mapping.
+
+        The bundles are built once when loading the translations. A bundle
+        keeps its translations after a reload, get it again to see changes.
+
+        Args:
+            lang (Lang): The language.
+
+        Returns:
+            Mapping[str, str]: The translations by key.
+
+        Raises:
+            KeyError: If the language is unknown.
+
+        """
+        return self._state.bundles[lang]
@@ -1,3 +1,10 @@
-from ssrq_utils.idno import filter, model
+from typing import TYPE_CHECKING
 
-__all__ = ["filter", "model"]
+from ssrq_utils._lazy import attach
+
+if TYPE_CHECKING:
+    from ssrq_utils.idno import cache, codec, columnar, compact, filter, index, model, volume
+
+__all__ = ["cache", "codec", "columnar", "compact", "filter", "index", "model", "volume"]
+
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -0,0 +1,101 @@
+import threading
+from typing import NamedTuple
+
+import cachebox
+
+from ssrq_utils.idno.model import IDNO
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `IDNOCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    size: int
+
+
+class IDNOCache:
+    """A bounded, thread-safe cache in front of `IDNO.model_validate_string`.
+
+    Parsed IDNOs are interned: the same string always returns the
+    same instance, as long as it is kept in the cache. The least
+    recently used entries are evicted first.
+
+    Args:
+        maxsize (int): The maximum number of cached IDNOs, `0` means unbounded.
+
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:  # noqa: D107
+        self._lock = threading.Lock()
+        self._cache: cachebox.LRUCache[str, IDNO] = cachebox.LRUCache(maxsize=maxsize)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, idno: str) -> IDNO:
+        """Get the parsed IDNO for the given string.
+
+        Args:
+            idno (str): The IDNO string.
+
+        Returns:
+            IDNO: The cached or newly parsed instance.
+
+        Raises:
+            ValueError: If the string does not match the schema, invalid strings are never cached.
+
+        """
+        with self._lock:
+            if (instance := self._cache.get(idno)) is not None:
+                self._hits += 1
+                return instance
+            self._misses += 1
+
+        # parse outside of the lock, if another thread was faster its instance wins
+        instance = IDNO.model_validate_string(idno)
+        with self._lock:
+            return self._cache.setdefault(idno, instance)
+
+    def info(self) -> CacheInfo:
+        """Get the hit / miss statistics and the size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._cache.maxsize, len(self._cache))
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum size of the cache, keeping the most recently used entries.
+
+        Args:
+            maxsize (int): The new maximum number of cached IDNOs.
+
+        """
+        with self._lock:
+            resized: cachebox.LRUCache[str, IDNO] = cachebox.LRUCache(maxsize=maxsize)
+            # items are ordered from the least to the most recently used one
+            for key, value in list(self._cache.items())[-maxsize:]:
+                resized.insert(key, value)
+            self._cache = resized
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+IDNO_CACHE = IDNOCache()
+"""The shared cache used by `validate_string`."""
+
+
+def validate_string(idno: str) -> IDNO:
+    """Validate an IDNO string using the shared `IDNO_CACHE`.
+
+    Args:
+        idno (str): The IDNO string.
+
+    Returns:
+        IDNO: The interned IDNO instance.
+
+    """
+    return IDNO_CACHE.get(idno)
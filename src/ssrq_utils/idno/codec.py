@@ -0,0 +1,96 @@
+from collections.abc import Iterable, Iterator
+
+from ssrq_utils._codec import _CORRUPT, Buffer, _decode, _Encoder, _read_fields
+from ssrq_utils.idno.compact import CompactIDNO
+from ssrq_utils.idno.index import AnyIDNO
+from ssrq_utils.idno.model import IDNO, IDNOFields
+
+MAGIC = b"SSRQIDNO"
+
+
+def _records(data: memoryview, pos: int, count: int, strings: list[str]) -> Iterator[IDNOFields]:
+    """Decode the records of a buffer one by one."""
+    try:
+        for _ in range(count):
+            fields, pos = _read_fields(data, pos + 1, data[pos], strings)
+            yield fields
+    except IndexError:
+        raise ValueError(_CORRUPT) from None
+
+
+def encode_idnos(idnos: Iterable[AnyIDNO]) -> bytes:
+    """Encode a sequence of IDNOs into a compact binary buffer.
+
+    Meant for passing many IDNOs between processes or storing them in a
+    cache, instead of pickling the models. Prefix, kanton, volume, opening
+    and special markers are stored once in a string table and referenced
+    by their position, the numbers are stored as varints.
+
+    Args:
+        idnos (Iterable[AnyIDNO]): The IDNOs, models or compact ones.
+
+    Returns:
+        bytes: The buffer, see `decode_idnos`.
+
+    Raises:
+        ValueError: If a case, document or tradition number is negative.
+
+    """
+    encoder = _Encoder()
+    for idno in idnos:
+        encoder.add(idno)
+    return encoder.build(MAGIC)
+
+
+def iter_idno_fields(buffer: Buffer) -> Iterator[IDNOFields]:
+    """Lazily decode the fields of the IDNOs in a buffer created by `encode_idnos`.
+
+    The buffer is read in place, e.g. from shared memory or a memory map,
+    only the string table is copied.
+
+    Args:
+        buffer (Buffer): The buffer.
+
+    Returns:
+        Iterator[IDNOFields]: The fields in the order of the encoded IDNOs.
+
+    Raises:
+        ValueError: If the buffer was not created by `encode_idnos`.
+
+    """
+    return _records(*_decode(buffer, MAGIC))
+
+
+def decode_idnos(buffer: Buffer) -> list[IDNO]:
+    """Decode the IDNOs in a buffer created by `encode_idnos`.
+
+    The fields have been validated when encoding, so the models are
+    built without running the pydantic validation. Equal IDNOs share
+    the same instance.
+
+    Args:
+        buffer (Buffer): The buffer.
+
+    Returns:
+        list[IDNO]: The IDNOs in their encoded order.
+
+    Raises:
+        ValueError: If the buffer was not created by `encode_idnos`.
+
+    """
+    construct = IDNO._construct_unchecked
+    instances: dict[IDNOFields, IDNO] = {}
+    idnos: list[IDNO] = []
+
+    for fields in iter_idno_fields(buffer):
+        if (idno := instances.get(fields)) is None:
+            idno = instances[fields] = construct(fields)
+        idnos.append(idno)
+
+    return idnos
+
+
+def decode_compact_idnos(buffer: Buffer) -> list[CompactIDNO]:
+    """Decode the IDNOs in a buffer created by `encode_idnos` as `CompactIDNO`s, see `decode_idnos`."""
+    from_fields = CompactIDNO.from_fields
+    return [from_fields(fields) for fields in iter_idno_fields(buffer)]
@@ -0,0 +1,271 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Any, NamedTuple
+
+from ssrq_utils.idno.compact import CompactIDNO
+from ssrq_utils.idno.model import (
+    _FIELD_NAMES,
+    IDNO,
+    SCHEMA,
+    SCHEMA_RE,
+    IDNOFields,
+    _int_sort_key,
+    _opening_key,
+    _parse_many,
+)
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None  # type: ignore[assignment]
+
+# the number of IDNOs parsed and appended to the columns at once
+_CHUNK_SIZE = 1 << 16
+_INT64_BITS = 64
+
+_FIELDS = attrgetter(*_FIELD_NAMES)
+_COLUMNS = [itemgetter(i) for i in range(len(_FIELD_NAMES))]
+
+
+class CategoricalColumn(NamedTuple):
+    """A column of strings, stored as codes into the sorted categories.
+
+    Missing values have the code `-1`. As the categories are sorted,
+    comparing codes is equivalent to comparing the strings. Openings are
+    sorted naturally, see `index.index_key`.
+    """
+
+    codes: array
+    categories: list[str]
+
+
+class IntColumn(NamedTuple):
+    """A column of integers, the mask is `1` where a value is missing (and stored as `0`)."""
+
+    values: array
+    mask: array
+
+
+class IDNOColumns(NamedTuple):
+    """Typed columns of a collection of IDNOs.
+
+    All arrays implement the buffer protocol, so they can be wrapped
+    without copying, e.g. by `numpy.frombuffer`, to sort and filter
+    a collection with vectorized operations.
+    """
+
+    prefix: CategoricalColumn
+    kanton: CategoricalColumn
+    volume: CategoricalColumn
+    opening: CategoricalColumn
+    special: CategoricalColumn
+    case: IntColumn
+    doc: IntColumn
+    num: IntColumn
+    sort_key: array
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self.sort_key)
+
+    def argsort(self) -> array:
+        """Get the row indices in the order of the IDNOs (see `index.index_key`).
+
+        The parts of the key of a row are packed into a single integer, from
+        the prefix in the highest to the tradition number in the lowest bits,
+        each part taking as many bits as its largest value needs. If NumPy
+        is installed, the keys are composed and sorted vectorized as int64
+        (falling back to `numpy.lexsort` if they do not fit into 63 bits).
+        Without NumPy, a Python int is composed per row and the rows are
+        sorted by `sorted`, which is several times slower.
+
+        Returns
+        -------
+            array: The row indices as int64.
+
+        """
+        if not len(self):
+            return array("q")
+        columns = [
+            self.prefix.codes,
+            self.kanton.codes,
+            self.volume.codes,
+            self.opening.codes,
+            self.special.codes,
+            self.case.values,
+            self.case.mask,
+            self.doc.values,
+            self.doc.mask,
+            self.num.values,
+            self.num.mask,
+        ]
+        if np is not None:
+            return _argsort_numpy(columns)
+        return _argsort_python(columns)
+
+
+def _argsort_numpy(columns: list[array]) -> array:  # pragma: no cover - NumPy is optional
+    prefix, kanton, volume, opening, special, case, no_case, doc, no_doc, num, no_num = (
+        np.asarray(column, dtype=np.int64) for column in columns
+    )
+    has_case, has_doc = 1 - no_case, 1 - no_doc
+    # the parts of `index.index_key`, shifted to be non-negative (missing strings have the code -1)
+    values = [
+        prefix + 1,
+        kanton + 1,
+        volume + 1,
+        opening + 1,
+        (special >= 0).astype(np.int64),
+        np.where(has_case, case, doc),
+        has_case * has_doc * (doc + 1),
+        has_case,
+        has_doc,
+        special + 1,
+        (1 - no_num) * (num + 1),
+    ]
+    widths = [int(column.max()).bit_length() for column in values]
+
+    if sum(widths) < _INT64_BITS:
+        keys = np.zeros_like(values[0])
+        for column, width in zip(values, widths, strict=True):
+            keys = keys << width | column
+        order = np.argsort(keys, kind="stable")
+    else:
+        order = np.lexsort(values[::-1])
+
+    return array("q", order.astype(np.int64).tobytes())
+
+
+def _argsort_python(columns: list[array]) -> array:
+    prefix, kanton, volume, opening, special, case, no_case, doc, no_doc, num, no_num = columns
+    # the parts of `index.index_key`, shifted to be non-negative (missing strings have the code -1)
+    values = [
+        [code + 1 for code in prefix],
+        [code + 1 for code in kanton],
+        [code + 1 for code in volume],
+        [code + 1 for code in opening],
+        [code >= 0 for code in special],
+        [d if m else c for c, m, d in zip(case, no_case, doc, strict=True)],
+        [0 if m or n else d + 1 for m, n, d in zip(no_case, no_doc, doc, strict=True)],
+        [not m for m in no_case],
+        [not m for m in no_doc],
+        [code + 1 for code in special],
+        [0 if m else n + 1 for n, m in zip(num, no_num, strict=True)],
+    ]
+    keys = [0] * len(prefix)
+    for column in values:
+        # parts, which are 0 in all rows (e.g. no special documents), are skipped
+        if width := int(max(column)).bit_length():
+            keys = [key << width | value for key, value in zip(keys, column, strict=True)]
+    return array("q", sorted(range(len(keys)), key=keys.__getitem__))
+
+
+class _CategoricalBuilder:
+    def __init__(self, key: Callable[[str], Any] | None = None) -> None:
+        self.key = key
+        self.codes = array("i")
+        self.lookup: dict[str | None, int] = {None: -1}
+
+    def extend(self, values: list[str | None]) -> None:
+        lookup = self.lookup
+        for value in set(values).difference(lookup):
+            lookup[value] = len(lookup) - 1
+        self.codes.extend(map(lookup.__getitem__, values))
+
+    def build(self) -> CategoricalColumn:
+        categories = sorted((value for value in self.lookup if value is not None), key=self.key)
+        # indexed by the code of a string, -1 (missing) maps to the last item
+        remap = [-1] * len(self.lookup)
+        for sorted_code, category in enumerate(categories):
+            remap[self.lookup[category]] = sorted_code
+        return CategoricalColumn(array("i", map(remap.__getitem__, self.codes)), categories)
+
+
+class _IntBuilder:
+    def __init__(self) -> None:
+        self.values = array("q")
+        self.mask = array("B")
+
+    def extend(self, values: list[int | None]) -> None:
+        self.values.extend([0 if value is None else value for value in values])
+        self.mask.extend([value is None for value in values])
+
+    def build(self) -> IntColumn:
+        return IntColumn(self.values, self.mask)
+
+
+def _iter_chunks(idnos: Iterable[str | IDNO | CompactIDNO]) -> Iterator[list[IDNOFields]]:
+    """Get the fields of the IDNOs in chunks, the strings of a chunk are parsed at once."""
+    values = iter(idnos)
+    while chunk := list(islice(values, _CHUNK_SIZE)):
+        strings = [value for value in chunk if isinstance(value, str)]
+        if not strings:
+            yield list(map(_FIELDS, chunk))
+            continue
+
+        parsed = _parse_many(strings, SCHEMA_RE)
+        if None in parsed:
+            invalid = strings[parsed.index(None)]
+            raise ValueError(f"IDNO {invalid} does not match the schema {SCHEMA}")
+        if len(strings) == len(chunk):
+            yield parsed  # type: ignore[misc]
+            continue
+
+        fields = iter(parsed)
+        yield [
+            next(fields) if isinstance(value, str) else _FIELDS(value)  # type: ignore[misc]
+            for value in chunk
+        ]
+
+
+def to_columns(idnos: Iterable[str | IDNO | CompactIDNO]) -> IDNOColumns:
+    """Convert a collection of IDNOs into typed columns in a single pass.
+
+    Strings are parsed without creating IDNO instances. The input is
+    consumed in chunks, the columns are filled chunk by chunk with `map`
+    and `extend`, without calling Python code per value.
+
+    Args:
+    ----
+        idnos: IDNO strings, models or compact IDNOs.
+
+    Returns:
+    -------
+        The columns, one row per IDNO.
+
+    Raises:
+    ------
+        ValueError: If a string does not match the schema.
+
+    """
+    prefix, kanton, volume, special = (_CategoricalBuilder() for _ in range(4))
+    opening = _CategoricalBuilder(_opening_key)
+    case, doc, num = _IntBuilder(), _IntBuilder(), _IntBuilder()
+    sort_key = array("q")
+
+    for chunk in _iter_chunks(idnos):
+        prefixes, kantons, volumes, cases, openings, docs, nums, specials = (
+            list(map(column, chunk)) for column in _COLUMNS
+        )
+        prefix.extend(prefixes)
+        kanton.extend(kantons)
+        volume.extend(volumes)
+        case.extend(cases)
+        opening.extend(openings)
+        doc.extend(docs)
+        num.extend(nums)
+        special.extend(specials)
+        sort_key.extend(map(_int_sort_key, cases, docs))
+
+    return IDNOColumns(
+        prefix=prefix.build(),
+        kanton=kanton.build(),
+        volume=volume.build(),
+        opening=opening.build(),
+        special=special.build(),
+        case=case.build(),
+        doc=doc.build(),
+        num=num.build(),
+        sort_key=sort_key,
+    )
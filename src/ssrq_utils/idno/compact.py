@@ -0,0 +1,157 @@
+import sys
+from collections.abc import Iterable
+from typing import NamedTuple, Self
+
+from ssrq_utils.idno.model import (
+    IDNO,
+    SCHEMA,
+    SCHEMA_RE,
+    IDNOFields,
+    _format,
+    _int_sort_key,
+    _is_main,
+    _normalized_sort_key,
+    _parse_many,
+    _sort_key,
+)
+from ssrq_utils.idno.volume import VOLUMES, Volume
+
+
+class CompactIDNO(NamedTuple):
+    """A compact, immutable and hashable representation of an SSRQ identifier.
+
+    Offers the same behaviour as `IDNO`, but is backed by a tuple. Meant
+    for hot paths, which need to hold a lot of identifiers in memory.
+    The strings of prefix, kanton and volume are interned (the volume in
+    `VOLUMES`), when created through one of the `from_*` constructors.
+    """
+
+    prefix: str
+    kanton: str
+    volume: str
+    case: int | None = None
+    opening: str | None = None
+    doc: int | None = None
+    num: int | None = None
+    special: str | None = None
+
+    @classmethod
+    def from_fields(cls, fields: IDNOFields) -> Self:
+        """Create an instance from the fields of a parsed IDNO.
+
+        Args:
+        ----
+            fields: The fields in the order of the `IDNO` model.
+
+        Returns:
+        -------
+            An instance with interned strings.
+
+        """
+        prefix, kanton, volume, case, opening, doc, num, special = fields
+        return cls(
+            sys.intern(prefix),
+            sys.intern(kanton),
+            VOLUMES.intern(volume).name,
+            case,
+            opening,
+            doc,
+            num,
+            special,
+        )
+
+    @classmethod
+    def from_model(cls, idno: IDNO) -> Self:
+        """Create an instance from an `IDNO` model.
+
+        Args:
+        ----
+            idno: The IDNO to convert.
+
+        Returns:
+        -------
+            An instance with the same fields.
+
+        """
+        return cls.from_fields(
+            (
+                idno.prefix,
+                idno.kanton,
+                idno.volume,
+                idno.case,
+                idno.opening,
+                idno.doc,
+                idno.num,
+                idno.special,
+            )
+        )
+
+    @classmethod
+    def from_string(cls, idno: str) -> Self:
+        """Validate an IDNO string against the schema and return an instance.
+
+        Raises
+        ------
+            ValueError: If the string does not match the schema.
+
+        """
+        return cls.from_strings([idno])[0]
+
+    @classmethod
+    def from_strings(cls, idnos: Iterable[str]) -> list[Self]:
+        """Validate many IDNO strings against the schema, without creating `IDNO` models.
+
+        Raises
+        ------
+            ValueError: If one of the strings does not match the schema.
+
+        """
+        values = idnos if isinstance(idnos, list) else list(idnos)
+        result = []
+        for idno, fields in zip(values, _parse_many(values, SCHEMA_RE), strict=True):
+            if fields is None:
+                raise ValueError(f"IDNO {idno} does not match the schema {SCHEMA}")
+            result.append(cls.from_fields(fields))
+        return result
+
+    def to_model(self) -> IDNO:
+        """Convert the instance into an `IDNO` model.
+
+        Returns
+        -------
+            The validated model with the same fields.
+
+        """
+        return IDNO.model_validate(self._asdict())
+
+    @property
+    def sort_key(self) -> float:
+        """Get a key to sort the ID, see `IDNO.sort_key`."""
+        return _sort_key(self.case, self.doc)
+
+    @property
+    def normalized_sort_key(self) -> str:
+        """Get a normalized key to sort the ID, see `IDNO.normalized_sort_key`."""
+        return _normalized_sort_key(self.case, self.doc)
+
+    @property
+    def int_sort_key(self) -> int:
+        """Get an integer key to sort the ID, see `IDNO.int_sort_key`."""
+        return _int_sort_key(self.case, self.doc)
+
+    def is_main(self) -> bool:
+        """Check if an IDNO represents a 'main document', see `IDNO.is_main`."""
+        return _is_main(self.case, self.doc)
+
+    @property
+    def volume_info(self) -> Volume:
+        """Get the shared entry of the volume, see `IDNO.volume_info`."""
+        return VOLUMES.intern(self.volume)
+
+    def print_volume(self) -> str:
+        """Format the volume for printing (human readable version), see `IDNO.print_volume`."""
+        return VOLUMES.intern(self.volume).printed
+
+    def __repr__(self) -> str:
+        """Produce the original string of the IDNO."""
+        return _format(self)
@@ -1,7 +1,18 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Generic, NamedTuple, TypeVar
 
+from ssrq_utils.idno.compact import CompactIDNO
 from ssrq_utils.idno.model import IDNO
 
+T = TypeVar("T", IDNO, CompactIDNO)
+
+
+class CaseGroup(NamedTuple, Generic[T]):
+    """A main document together with the documents of its case."""
+
+    main: T
+    documents: list[T]
+
 
 def get_main_idnos(idnos: Sequence[IDNO]) -> Sequence[IDNO] | None:
     """Filter a sequence of IDNOs.
@@ -20,4 +31,64 @@ def get_main_idnos(idnos: Sequence[IDNO]) -> Sequence[IDNO] | None:
         The filtered sequence of IDNOs.
 
     """
-    return result if (result := [idno for idno in idnos if idno.is_main()]) else None
+    return result if (result := list(iter_main_idnos(idnos))) else None
+
+
+def iter_main_idnos(idnos: Iterable[T]) -> Iterator[T]:
+    """Lazily filter the IDNOs representing a 'main document'.
+
+    Works like `get_main_idnos`, but accepts any iterable and
+    yields the IDNOs one by one.
+
+    Args:
+    ----
+        idnos: The IDNOs to filter.
+
+    Returns:
+    -------
+        An iterator over the main documents.
+
+    """
+    return (idno for idno in idnos if idno.is_main())
+
+
+def group_by_case(idnos: Iterable[T]) -> Iterator[CaseGroup[T]]:
+    """Group the documents of a case ('Mantelstück') under their main document in a single pass.
+
+    The IDNOs need to be in their document order (e.g. as returned
+    by an `IDNOIndex`), so that the documents of a case follow
+    their main document. Main documents without a case result in
+    a group without documents. A document of a case, which does
+    not follow its main document, starts a group of its own.
+
+    Args:
+    ----
+        idnos: The ordered IDNOs.
+
+    Returns:
+    -------
+        An iterator over the groups in document order.
+
+    """
+    current: CaseGroup[T] | None = None
+
+    for idno in idnos:
+        if current is not None and not idno.is_main() and _same_case(current.main, idno):
+            current.documents.append(idno)
+            continue
+        if current is not None:
+            yield current
+        current = CaseGroup(idno, [])
+
+    if current is not None:
+        yield current
+
+
+def _same_case(main: T, idno: T) -> bool:
+    return (
+        main.case is not None
+        and main.case == idno.case
+        and main.volume == idno.volume
+        and main.kanton == idno.kanton
+        and main.prefix == idno.prefix
+    )
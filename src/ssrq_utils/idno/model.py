@@ -1,8 +1,26 @@
+import contextlib
 import re
+import sys
+from collections.abc import Iterable
 from functools import cached_property
-from typing import Self, TypeVar
+from typing import NamedTuple, Self, TypeVar
 
-from pydantic import BaseModel, Field, computed_field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+from ssrq_utils.idno.volume import VOLUMES, Volume
+
+try:
+    from ssrq_utils.uca._pyferuca import parse_idno as _native_parse_idno
+    from ssrq_utils.uca._pyferuca import parse_idnos as _native_parse_idnos
+except ImportError:  # pragma: no cover - the extension is not built
+    _native_parse_idno = _native_parse_idnos = None  # type: ignore[assignment]
 
 SCHEMA = (
     r"^"
@@ -18,6 +36,158 @@ SCHEMA_RE = re.compile(SCHEMA)
 
 T = TypeVar("T", int, str)
 
+_FIELD_NAMES = ("prefix", "kanton", "volume", "case", "opening", "doc", "num", "special")
+
+# shared by the instances created by `IDNO._construct_unchecked`, frozen models never
+# change it and `model_copy` copies it before adding fields
+_FIELDS_SET = set(_FIELD_NAMES)
+
+IDNOFields = tuple[str, str, str, int | None, str | None, int | None, int | None, str | None]
+"""The fields of an IDNO in the order of `_FIELD_NAMES`."""
+
+
+class IDNOParseError(NamedTuple):
+    """An entry of the error report produced by `IDNO.model_validate_strings`."""
+
+    position: int
+    value: str
+    message: str
+
+
+class IDNOBatch(NamedTuple):
+    """The result of parsing many IDNO strings at once."""
+
+    idnos: list["IDNO"]
+    errors: list[IDNOParseError]
+
+
+def _check_and_cast(value: str | None, caster: type[T]) -> T | None:
+    if value is None:
+        return None
+    value = value.removesuffix(".")
+    if caster is int and value.isdigit():
+        return caster(value)
+    if caster is str and value.strip():
+        return caster(value)
+    return None
+
+
+def _fields_from_match(m: re.Match[str]) -> IDNOFields:
+    prefix, kanton, volume, case_or_opening, doc, num, special = m.group(
+        "prefix", "kanton", "volume", "caseOrOpening", "doc", "num", "special"
+    )
+    case = _check_and_cast(case_or_opening, int)
+    return (
+        prefix,
+        kanton,
+        volume,
+        case,
+        None if case is not None else _check_and_cast(case_or_opening, str),
+        _check_and_cast(doc, int),
+        _check_and_cast(num, int),
+        _check_and_cast(special, str),
+    )
+
+
+def _parse_fields(idnos: list[str], schema: re.Pattern = SCHEMA_RE) -> list[IDNOFields | None]:
+    """Parse IDNO strings into field tuples, `None` marks strings not matching the schema.
+
+    Relies on the guarantees of the schema (digits for doc / num, a trailing
+    dot after the case or opening) instead of casting every group separately.
+    """
+    match = schema.match
+    result: list[IDNOFields | None] = []
+
+    for idno in idnos:
+        if (m := match(idno)) is None:
+            result.append(None)
+            continue
+        prefix, kanton, volume, case_or_opening, doc, num, special = m.group(
+            "prefix", "kanton", "volume", "caseOrOpening", "doc", "num", "special"
+        )
+        case = doc_no = num_no = None
+        opening = None
+        if special is None:
+            if case_or_opening:
+                case_or_opening = case_or_opening[:-1]
+                if case_or_opening.isdigit():
+                    case = int(case_or_opening)
+                else:
+                    opening = case_or_opening
+            doc_no, num_no = int(doc), int(num)
+        result.append((prefix, kanton, volume, case, opening, doc_no, num_no, special))
+
+    return result
+
+
+def _parse_many(idnos: list[str], schema: re.Pattern) -> list[IDNOFields | None]:
+    if _native_parse_idnos is None or schema is not SCHEMA_RE:
+        return _parse_fields(idnos, schema)
+
+    result = _native_parse_idnos(idnos)
+    # the native parser rejects a few strings the schema accepts (numbers beyond 64 bit,
+    # a trailing newline matched by `$`), so rejected strings are checked again
+    rejected = [i for i, fields in enumerate(result) if fields is None]
+    if rejected:
+        checked = _parse_fields([idnos[i] for i in rejected], schema)
+        for i, fields in zip(rejected, checked, strict=True):
+            result[i] = fields
+    return result
+
+
+def _sort_key(case: int | None, doc: int | None) -> float:
+    if case and doc and doc > 0:
+        return float(f"{case}.{doc}")
+
+    return float(next(filter(None, (case, doc, 99999))))
+
+
+def _normalized_sort_key(case: int | None, doc: int | None) -> str:
+    if case and doc and doc > 0:
+        return f"{case:05d}.{doc:05d}"
+
+    return f"{next(filter(None, (case, doc, 99999))):05d}.00000"
+
+
+def _int_sort_key(case: int | None, doc: int | None) -> int:
+    if case and doc and doc > 0:
+        return case << 32 | doc
+
+    return next(filter(None, (case, doc, 99999))) << 32
+
+
+OpeningKey = tuple[tuple[bool, int, str], ...]
+
+
+def _opening_key(opening: str | None) -> OpeningKey:
+    """Order openings naturally, their numeric parts by value, e.g. 2.A before 10.A.
+
+    The parts keep their string as the last item, so the key is unique
+    (e.g. for 01 and 1) and numbers never get compared with letters.
+    """
+    if opening is None:
+        return ()
+    return tuple(
+        (False, int(part), part) if part.isdecimal() else (True, 0, part)
+        for part in opening.split(".")
+    )
+
+
+def _is_main(case: int | None, doc: int | None) -> bool:
+    return not (case is not None and doc is not None and doc > 0)
+
+
+def _format(fields: IDNOFields) -> str:
+    prefix, kanton, volume, case, opening, doc, num, special = fields
+    start = f"{prefix}-{kanton}-{volume}"
+    if special is not None:
+        return f"{start}-{special}"
+    if opening is not None:
+        return f"{start}-{opening}.{doc}-{num}"
+    if case is not None:
+        return f"{start}-{case}.{doc}-{num}"
+    return f"{start}-{doc}-{num}"
+
 
 class IDNO(BaseModel):
     """A model to represent an SSRQ identifier."""
@@ -36,6 +206,7 @@ class IDNO(BaseModel):
     special: str | None = Field(
         default=None, description="Marker for a special document like an introduction", frozen=True
     )
+    model_config = ConfigDict(frozen=True)
 
     @computed_field  # type: ignore[misc]
     @cached_property
@@ -47,10 +218,7 @@ class IDNO(BaseModel):
             A float key to sort the IDNO.
 
         """
-        if self.case and self.doc and self.doc > 0:
-            return float(f"{self.case}.{self.doc}")
-
-        return float(next(filter(None, (self.case, self.doc, 99999))))
+        return _sort_key(self.case, self.doc)
 
     @computed_field  # type: ignore[misc]
     @cached_property
@@ -64,10 +232,46 @@ class IDNO(BaseModel):
             str: Zero-padded string key for sorting the ID.
 
         """
-        if self.case and self.doc and self.doc > 0:
-            return f"{self.case:05d}.{self.doc:05d}"
+        return _normalized_sort_key(self.case, self.doc)
+
+    @cached_property
+    def int_sort_key(self) -> int:
+        """Get an integer key to sort the ID.
+
+        Orders like `normalized_sort_key`, the number of the case (or of
+        the document) is stored in the upper, the number of the document
+        within a case in the lower 32 bits. Not part of the serialized model.
+
+        Like `normalized_sort_key`, the key is not unique, e.g. 5-1 and 5.0-1
+        share it, and documents within a case must be below 2^32. Use
+        `index.index_key` for a unique order.
+
+        Returns
+        -------
+            int: The key for sorting the ID.
+
+        """
+        return _int_sort_key(self.case, self.doc)
+
+    @property
+    def volume_info(self) -> Volume:
+        """Get the shared entry of the volume, see `VolumeRegistry`.
+
+        Looked up on each access, which costs a dict lookup, so that it
+        always matches the volume, e.g. after `model_copy`.
 
-        return f"{next(filter(None, (self.case, self.doc, 99999))):05d}.00000"
+        Returns
+        -------
+            Volume: The volume with its precomputed printed form and sort key.
+
+        """
+        return VOLUMES.intern(self.volume)
+
+    @field_validator("volume")
+    @classmethod
+    def intern_volume(cls, volume: str) -> str:
+        """Share the volume string with all other IDNOs of the same volume."""
+        return VOLUMES.intern(volume).name
 
     @model_validator(mode="after")
     def check_exclusive_fields(self) -> Self:
@@ -83,32 +287,103 @@ class IDNO(BaseModel):
     @classmethod
     def model_validate_string(cls, idno: str, schema: re.Pattern = SCHEMA_RE) -> Self:
         """Validate an IDNO string against the schema and return an instance of the model."""
+        fields: IDNOFields | None = None
+        if _native_parse_idno is not None and schema is SCHEMA_RE:
+            # rejected strings are checked against the schema below, see `_parse_many`
+            with contextlib.suppress(ValueError):
+                fields = _native_parse_idno(idno)
+        if fields is None:
+            if (m := schema.match(idno)) is None:
+                raise ValueError(f"IDNO {idno} does not match the schema {schema.pattern}")
+            fields = _fields_from_match(m)
 
-        def check_and_cast(value: str, caster: type[T]) -> T | None:
-            if value is None:
-                return None
-            value = value.removesuffix(".")
-            if caster is int and value.isdigit():
-                return caster(value)
-            if caster is str and value.strip():
-                return caster(value)
-            return None
-
-        if (m := schema.match(idno)) is None:
-            raise ValueError(f"IDNO {idno} does not match the schema {schema.pattern}")
-
-        case = check_and_cast(m.group("caseOrOpening"), int)
+        prefix, kanton, volume, case, opening, doc, num, special = fields
         return cls(
-            prefix=m.group("prefix"),
-            kanton=m.group("kanton"),
-            volume=m.group("volume"),
+            prefix=prefix,
+            kanton=kanton,
+            volume=volume,
             case=case,
-            opening=None if case is not None else check_and_cast(m.group("caseOrOpening"), str),
-            doc=check_and_cast(m.group("doc"), caster=int),
-            num=check_and_cast(m.group("num"), caster=int),
-            special=check_and_cast(m.group("special"), caster=str),
+            opening=opening,
+            doc=doc,
+            num=num,
+            special=special,
         )
 
+    @classmethod
+    def model_validate_strings(  # type: ignore[override]
+        cls, idnos: Iterable[str], schema: re.Pattern = SCHEMA_RE
+    ) -> IDNOBatch:
+        """Validate many IDNO strings at once.
+
+        Meant for bulk operations like rebuilding an index. The field
+        invariants are guaranteed by the schema, so the instances are built
+        without running the pydantic validation. If the native extension is
+        available, the default schema is parsed there without holding the GIL.
+        Strings occurring more than once are parsed once and share the same instance.
+
+        For distinct strings this is only about 1.5 to 2 times as fast as
+        calling `model_validate_string` in a loop: creating a model instance
+        costs about 2 µs even without validation, which bounds the speedup.
+
+        Note: Replaces pydantic's `model_validate_strings`, which is of no
+        use for this model.
+
+        Args:
+        ----
+            idnos: The IDNO strings to validate.
+            schema: The schema to validate against, must provide the same groups as `SCHEMA`.
+
+        Returns:
+        -------
+            The parsed IDNOs and an error report with one entry per invalid string.
+
+        """
+        values = idnos if isinstance(idnos, list) else list(idnos)
+        unique = list(dict.fromkeys(values))
+        construct = cls._construct_unchecked
+        instances = {
+            idno: None if fields is None else construct(fields)
+            for idno, fields in zip(unique, _parse_many(unique, schema), strict=True)
+        }
+
+        parsed: list[IDNO] = []
+        errors: list[IDNOParseError] = []
+        for i, idno in enumerate(values):
+            if (instance := instances[idno]) is None:
+                errors.append(
+                    IDNOParseError(
+                        i, idno, f"IDNO {idno} does not match the schema {schema.pattern}"
+                    )
+                )
+                continue
+            parsed.append(instance)
+
+        return IDNOBatch(parsed, errors)
+
+    @classmethod
+    def _construct_unchecked(cls, fields: IDNOFields) -> Self:
+        """Create an instance from already validated fields, bypassing pydantic."""
+        prefix, kanton, volume, case, opening, doc, num, special = fields
+        instance = cls.__new__(cls)
+        object.__setattr__(
+            instance,
+            "__dict__",
+            {
+                "prefix": sys.intern(prefix),
+                "kanton": sys.intern(kanton),
+                "volume": VOLUMES.intern(volume).name,
+                "case": case,
+                "opening": opening,
+                "doc": doc,
+                "num": num,
+                "special": special,
+            },
+        )
+        object.__setattr__(instance, "__pydantic_fields_set__", _FIELDS_SET)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
     def is_main(self) -> bool:
         """Check if an IDNO represents a 'main document'.
 
@@ -117,37 +392,29 @@ class IDNO(BaseModel):
             True if the IDNO represents a 'main document'.
 
         """
-        return not (self.case is not None and self.doc is not None and self.doc > 0)
+        return _is_main(self.case, self.doc)
 
     def print_volume(self) -> str:
         """Format the volume for printing (human readable version).
 
         Returns
         -------
-            A human readable version of the volume.
+            A human readable version of the volume, precomputed once per volume.
 
         """
-        volume_parts = self.volume.split("_")
-        output = ""
-
-        for i, part in enumerate(volume_parts):
-            if i + 1 == len(volume_parts):
-                output += part
-                continue
-            if re.search(r"[IVX0-9]+", part):
-                output += f"{part}/"
-                continue
-            output += f"{part} "
-
-        return output
+        return self.volume_info.printed
 
     def __repr__(self) -> str:
         """Produce the original string of the IDNO."""
-        start = f"{self.prefix}-{self.kanton}-{self.volume}"
-        if self.special is not None:
-            return f"{start}-{self.special}"
-        if self.opening is not None:
-            return f"{start}-{self.opening}.{self.doc}-{self.num}"
-        if self.case is not None:
-            return f"{start}-{self.case}.{self.doc}-{self.num}"
-        return f"{start}-{self.doc}-{self.num}"
+        return _format(
+            (
+                self.prefix,
+                self.kanton,
+                self.volume,
+                self.case,
+                self.opening,
+                self.doc,
+                self.num,
+                self.special,
+            )
+        )
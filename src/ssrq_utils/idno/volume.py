@@ -0,0 +1,102 @@
+import re
+from collections.abc import Iterator
+from typing import NamedTuple
+
+_NUMBERED_PART_RE = re.compile(r"[IVX0-9]+")
+_ROMAN_NUMERAL_RE = re.compile(r"[IVX]+")
+_ROMAN_DIGITS = {"I": 1, "V": 5, "X": 10}
+
+VolumeSortKey = tuple[tuple[int, int | str], ...]
+
+
+def _print_volume(volume: str) -> str:
+    volume_parts = volume.split("_")
+    output = ""
+
+    for i, part in enumerate(volume_parts):
+        if i + 1 == len(volume_parts):
+            output += part
+            continue
+        if _NUMBERED_PART_RE.search(part):
+            output += f"{part}/"
+            continue
+        output += f"{part} "
+
+    return output
+
+
+def _roman_to_int(numeral: str) -> int:
+    values = [_ROMAN_DIGITS[digit] for digit in numeral]
+    return sum(
+        -value if i + 1 < len(values) and value < values[i + 1] else value
+        for i, value in enumerate(values)
+    )
+
+
+def _volume_sort_key(volume: str) -> VolumeSortKey:
+    key: list[tuple[int, int | str]] = []
+    for part in volume.split("_"):
+        if part.isdigit():
+            key.append((0, int(part)))
+        elif _ROMAN_NUMERAL_RE.fullmatch(part):
+            key.append((0, _roman_to_int(part)))
+        else:
+            key.append((1, part))
+    return tuple(key)
+
+
+class Volume(NamedTuple):
+    """A volume shared by all IDNOs referencing it, see `VolumeRegistry`."""
+
+    name: str
+    printed: str
+    """The human readable version of the volume, e.g. "NF I/1/3" for NF_I_1_3."""
+    sort_key: VolumeSortKey
+    """Orders volumes naturally: numbers (arabic or roman) by their value, e.g. I_2 before I_10."""
+
+
+class VolumeRegistry:
+    """Interns volumes and precomputes their printed form and sort order.
+
+    There are only a few hundred distinct volumes, which are referenced
+    by a lot of documents. Each volume is formatted once, when it is
+    interned, all later lookups return the same `Volume`. Entries are
+    never removed.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._volumes: dict[str, Volume] = {}
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._volumes)
+
+    def __iter__(self) -> Iterator[Volume]:  # noqa: D105
+        return iter(list(self._volumes.values()))
+
+    def __contains__(self, name: object) -> bool:  # noqa: D105
+        return name in self._volumes
+
+    def intern(self, name: str) -> Volume:
+        """Get the shared entry of a volume, registering it if necessary.
+
+        Args:
+            name (str): The volume, e.g. NF_I_1_3.
+
+        Returns:
+            Volume: The entry of the volume.
+
+        """
+        if (volume := self._volumes.get(name)) is None:
+            # setdefault keeps the entry of a concurrent call, so that it is shared
+            volume = self._volumes.setdefault(
+                name, Volume(name, _print_volume(name), _volume_sort_key(name))
+            )
+        return volume
+
+    def sorted(self) -> list[Volume]:
+        """Get all registered volumes in their natural order, see `Volume.sort_key`."""
+        return sorted(self, key=lambda volume: volume.sort_key)
+
+
+VOLUMES = VolumeRegistry()
+"""The registry used by `IDNO` and `CompactIDNO`."""
@@ -1,6 +1,31 @@
-from ssrq_utils.uca._pyferuca import uca_complex_sort, uca_simple_sort
+from ssrq_utils.uca._pyferuca import (
+    Collator,
+    uca_bisect_left,
+    uca_bisect_right,
+    uca_complex_sort,
+    uca_insort,
+    uca_merge,
+    uca_prefix_range,
+    uca_ranks,
+    uca_simple_sort,
+    uca_sort,
+    uca_top_k,
+    uca_unique,
+)
+from ssrq_utils.uca.external import uca_external_sort
 
 __all__ = [
+    "Collator",
     "uca_simple_sort",
     "uca_complex_sort",
+    "uca_sort",
+    "uca_ranks",
+    "uca_bisect_left",
+    "uca_bisect_right",
+    "uca_insort",
+    "uca_prefix_range",
+    "uca_merge",
+    "uca_external_sort",
+    "uca_top_k",
+    "uca_unique",
 ]
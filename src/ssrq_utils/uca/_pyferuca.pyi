@@ -1,23 +1,44 @@
-from collections.abc import Sequence
-from typing import Any, TypeVar, overload
+from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
+from typing import Any, Literal, TypeVar, overload
 
 T = TypeVar("T", bound=object)
 
-def uca_simple_sort(inputs: Sequence[str]) -> Sequence[str]:
+def uca_simple_sort(inputs: Sequence[str], parallel_threshold: int | None = None) -> Sequence[str]:
     """Sort a list of strings using the UCA.
 
     Uses the unstable sorting mechanism of the Rust
     standard library, so the order of equal elements is
-    not preserved.
+    not preserved. The GIL is released while sorting.
 
     Args:
         inputs (Sequence[string]): The input strings.
+        parallel_threshold (int | None): The number of distinct strings from which on
+            they are sorted on all cores, defaults to 50 000.
 
     Returns:
         Sequence[string]: The sorted strings.
 
     """
 
+def uca_ranks(inputs: Sequence[str], parallel_threshold: int | None = None) -> list[int]:
+    """Compute the dense rank of each string in UCA order among the inputs.
+
+    Strings, which collate equal, share a rank. Sorting by the ranks is
+    equivalent to sorting the strings with the UCA, but only ranks computed
+    in the same call can be compared with each other. They are no sort keys,
+    which could be stored and compared later: the underlying collator does
+    not expose binary sort keys.
+
+    Args:
+        inputs (Sequence[string]): The input strings.
+        parallel_threshold (int | None): The number of distinct strings from which on
+            they are sorted on all cores, defaults to 50 000.
+
+    Returns:
+        list[int]: The rank of each string, in the order of the inputs.
+
+    """
+
 @overload
 def uca_complex_sort(inputs: Sequence[T], method_name: str) -> Sequence[T]:  # noqa: D418
     """Sort a list of objects using the UCA.
@@ -37,19 +58,457 @@ def uca_complex_sort(inputs: Sequence[T], method_name: str) -> Sequence[T]:  # n
     """
 
 @overload
-def uca_complex_sort(inputs: Sequence[T], method_name: str, args: tuple[Any] | None) -> Sequence[T]:  # noqa: D418
+def uca_complex_sort(  # noqa: D418
+    inputs: Sequence[T],
+    method_name: str,
+    args: tuple[Any] | None,
+    parallel_threshold: int | None = None,
+) -> Sequence[T]:
     """Sort a list of objects using the UCA.
 
     Uses the unstable sorting mechanism of the Rust
     standard library, so the order of equal elements is
-    not preserved.
+    not preserved. The GIL is released while sorting.
 
     Args:
         inputs (Sequence[T]): The input objects.
         method_name (str): The method name, used to get a value for sorting.
         args (tuple[Any]): The method arguments.
+        parallel_threshold (int | None): The number of distinct strings from which on
+            they are sorted on all cores, defaults to 50 000.
 
     Returns:
         Sequence[T]: The sorted objects.
 
     """
+
+@overload
+def uca_sort(  # noqa: D418
+    iterable: Iterable[str],
+    *,
+    key: None = None,
+    reverse: bool = False,
+    stable: bool = True,
+    parallel_threshold: int | None = None,
+) -> list[str]:
+    """Sort strings using the UCA, see the overload with a key function."""
+
+@overload
+def uca_sort(  # noqa: D418
+    iterable: Iterable[T],
+    *,
+    key: Callable[[T], str],
+    reverse: bool = False,
+    stable: bool = True,
+    parallel_threshold: int | None = None,
+) -> list[T]:
+    """Sort any iterable using the UCA, as a drop-in for `sorted`.
+
+    The iterable is consumed directly (e.g. a generator), the key function
+    is called exactly once per item. By default the sort is stable, also
+    when sorting in reverse order, so items with equal keys keep their
+    order like with `sorted`. The GIL is released while sorting.
+
+    Args:
+        iterable (Iterable[T]): The items to sort.
+        key (Callable[[T], str]): Returns the string to sort an item by.
+        reverse (bool): Sort in descending order.
+        stable (bool): Keep the order of items with equal keys, an unstable
+            sort is slightly faster.
+        parallel_threshold (int | None): The number of distinct keys from which on
+            they are sorted on all cores, defaults to 50 000.
+
+    Returns:
+        list[T]: The sorted items.
+
+    Raises:
+        TypeError: If a key is not a string.
+
+    """
+
+@overload
+def uca_bisect_left(  # noqa: D418
+    a: Sequence[str], x: str, lo: int = 0, hi: int | None = None, *, key: None = None
+) -> int:
+    """Locate the leftmost insertion point of a string, see the overload with a key function."""
+
+@overload
+def uca_bisect_left(  # noqa: D418
+    a: Sequence[T], x: str, lo: int = 0, hi: int | None = None, *, key: Callable[[T], str]
+) -> int:
+    """Locate the leftmost insertion point of a string in a UCA-sorted sequence.
+
+    Works like `bisect.bisect_left` with O(log n) comparisons, so an
+    entry can be looked up without sorting the sequence again.
+
+    Args:
+        a (Sequence[T]): The sequence, sorted with the default collation (e.g. by `uca_sort`).
+        x (str): The string to search for.
+        lo (int): The first index to consider.
+        hi (int | None): The index after the last one to consider, defaults to `len(a)`.
+        key (Callable[[T], str]): Returns the string of an item of `a`.
+
+    Returns:
+        int: The index, before which all items are less than `x`.
+
+    """
+
+@overload
+def uca_bisect_right(  # noqa: D418
+    a: Sequence[str], x: str, lo: int = 0, hi: int | None = None, *, key: None = None
+) -> int:
+    """Locate the rightmost insertion point of a string, see `uca_bisect_left`."""
+
+@overload
+def uca_bisect_right(  # noqa: D418
+    a: Sequence[T], x: str, lo: int = 0, hi: int | None = None, *, key: Callable[[T], str]
+) -> int:
+    """Locate the rightmost insertion point of a string, see `uca_bisect_left`."""
+
+@overload
+def uca_insort(  # noqa: D418
+    a: MutableSequence[str], x: str, lo: int = 0, hi: int | None = None, *, key: None = None
+) -> int:
+    """Insert a string into a UCA-sorted list, see the overload with a key function."""
+
+@overload
+def uca_insort(  # noqa: D418
+    a: MutableSequence[T], x: T, lo: int = 0, hi: int | None = None, *, key: Callable[[T], str]
+) -> int:
+    """Insert an item into a UCA-sorted list, like `bisect.insort`.
+
+    The item is inserted after any equal items, the list stays sorted
+    without sorting it again.
+
+    Args:
+        a (MutableSequence[T]): The list, sorted with the default collation.
+        x (T): The item to insert.
+        lo (int): The first index to consider.
+        hi (int | None): The index after the last one to consider, defaults to `len(a)`.
+        key (Callable[[T], str]): Returns the string of an item, it is applied to `x` as well.
+
+    Returns:
+        int: The index of the inserted item.
+
+    """
+
+@overload
+def uca_prefix_range(  # noqa: D418
+    a: Sequence[str], prefix: str, *, key: None = None
+) -> tuple[int, int]:
+    """Find the strings starting with a prefix, see the overload with a key function."""
+
+@overload
+def uca_prefix_range(  # noqa: D418
+    a: Sequence[T], prefix: str, *, key: Callable[[T], str]
+) -> tuple[int, int]:
+    """Find the items of a UCA-sorted sequence, which start with a prefix.
+
+    The prefix is compared on the (approximated, see `Collator`) primary
+    level, so "Zür" matches "Zürich" as well as "Zurich" and "zürcher".
+    The matching items are adjacent in the sequence, they are found by
+    two binary searches.
+
+    Args:
+        a (Sequence[T]): The sequence, sorted with the default collation.
+        prefix (str): The prefix.
+        key (Callable[[T], str]): Returns the string of an item of `a`.
+
+    Returns:
+        tuple[int, int]: The bounds `lo` and `hi` of the matching items `a[lo:hi]`.
+
+    """
+
+class UcaMerge(Iterator[T]):
+    """An iterator over the merged items of UCA-sorted iterables, see `uca_merge`."""
+
+    def __next__(self) -> T: ...
+
+@overload
+def uca_merge(*iterables: Iterable[str], key: None = None, reverse: bool = False) -> UcaMerge[str]:  # noqa: D418
+    """Merge UCA-sorted strings, see the overload with a key function."""
+
+@overload
+def uca_merge(  # noqa: D418
+    *iterables: Iterable[T], key: Callable[[T], str], reverse: bool = False
+) -> UcaMerge[T]:
+    """Lazily merge UCA-sorted iterables, like `heapq.merge`.
+
+    Only one item of each iterable is held at a time, so already sorted
+    inputs (e.g. the registers of the volumes) can be combined without
+    sorting them again. Items with equal keys are returned in the order
+    of the iterables.
+
+    Args:
+        *iterables (Iterable[T]): The iterables, each sorted with the default collation.
+        key (Callable[[T], str]): Returns the string to sort an item by.
+        reverse (bool): Whether the iterables are sorted in descending order.
+
+    Returns:
+        UcaMerge[T]: An iterator over the merged items.
+
+    """
+
+@overload
+def uca_top_k(  # noqa: D418
+    iterable: Iterable[str], k: int, *, key: None = None, reverse: bool = False
+) -> list[str]:
+    """Select the first `k` strings in UCA order, see the overload with a key function."""
+
+@overload
+def uca_top_k(  # noqa: D418
+    iterable: Iterable[T], k: int, *, key: Callable[[T], str], reverse: bool = False
+) -> list[T]:
+    """Select the first `k` items in UCA order.
+
+    Uses a partial sort instead of sorting all items, the result
+    equals `uca_sort(iterable, key=key, reverse=reverse)[:k]`.
+
+    Args:
+        iterable (Iterable[T]): The items.
+        k (int): The number of items to select.
+        key (Callable[[T], str]): Returns the string to sort an item by.
+        reverse (bool): Select the last items in UCA order instead.
+
+    Returns:
+        list[T]: The selected items in UCA order.
+
+    """
+
+@overload
+def uca_unique(  # noqa: D418
+    iterable: Iterable[str],
+    *,
+    key: None = None,
+    strength: Literal["primary", "secondary", "tertiary", "identical"] = "identical",
+    parallel_threshold: int | None = None,
+) -> list[str]:
+    """Sort strings and drop duplicates, see the overload with a key function."""
+
+@overload
+def uca_unique(  # noqa: D418
+    iterable: Iterable[T],
+    *,
+    key: Callable[[T], str],
+    strength: Literal["primary", "secondary", "tertiary", "identical"] = "identical",
+    parallel_threshold: int | None = None,
+) -> list[T]:
+    """Sort the items and drop the items, which are equal with the given strength.
+
+    Of each group of equal items, the first one is kept. E.g. with
+    `strength="primary"` only the first of "Zürich" and "Zurich" is kept.
+
+    Args:
+        iterable (Iterable[T]): The items.
+        key (Callable[[T], str]): Returns the string to sort an item by.
+        strength (Literal["primary", "secondary", "tertiary", "identical"]): Up to which
+            level items are distinguished, see `Collator`.
+        parallel_threshold (int | None): The number of distinct keys from which on
+            they are sorted on all cores, defaults to 50 000.
+
+    Returns:
+        list[T]: The distinct items in UCA order.
+
+    Raises:
+        ValueError: For an unknown strength.
+
+    """
+
+class SortKey:
+    """A string, which compares with the keys of other strings by collating them."""
+
+    def __lt__(self, other: SortKey) -> bool: ...
+    def __le__(self, other: SortKey) -> bool: ...
+    def __gt__(self, other: SortKey) -> bool: ...
+    def __ge__(self, other: SortKey) -> bool: ...
+
+class Collator:
+    """A configured UCA collator.
+
+    Instances are immutable and can be shared between threads. The
+    collation tables are set up once per thread and configuration, so
+    creating a collator once and reusing it avoids the setup costs for
+    many small sorts.
+
+    Args:
+        tailoring (Literal["cldr", "ducet"]): The collation tables, the CLDR
+            root collation or the DUCET.
+        shifting (bool): Whether spaces and punctuation are ignored, unless
+            strings are equal otherwise ('shifted' vs. 'non-ignorable').
+        strength (Literal["primary", "secondary", "tertiary", "identical"]):
+            Up to which level strings are distinguished: 'primary' ignores
+            accents and case, 'secondary' ignores case, 'tertiary' distinguishes
+            both and 'identical' additionally breaks ties by code points.
+            'primary' and 'secondary' are approximations: the strings are
+            collated on all levels after stripping accents (combining marks)
+            and lowercasing. Other differences still count, e.g. "Straße" and
+            "Strasse" differ at 'primary', ligatures or full-width letters
+            at 'secondary'.
+        parallel_threshold (int | None): The number of distinct strings from which on
+            they are sorted on all cores, defaults to 50 000.
+
+    Raises:
+        ValueError: For an unknown tailoring or strength.
+
+    """
+
+    tailoring: Literal["cldr", "ducet"]
+    shifting: bool
+    strength: Literal["primary", "secondary", "tertiary", "identical"]
+
+    def __init__(
+        self,
+        *,
+        tailoring: Literal["cldr", "ducet"] = "cldr",
+        shifting: bool = True,
+        strength: Literal["primary", "secondary", "tertiary", "identical"] = "identical",
+        parallel_threshold: int | None = None,
+    ) -> None: ...
+    @overload
+    def sort(
+        self,
+        iterable: Iterable[str],
+        *,
+        key: None = None,
+        reverse: bool = False,
+        stable: bool = True,
+    ) -> list[str]: ...
+    @overload
+    def sort(
+        self,
+        iterable: Iterable[T],
+        *,
+        key: Callable[[T], str],
+        reverse: bool = False,
+        stable: bool = True,
+    ) -> list[T]: ...
+    @overload
+    def top_k(
+        self, iterable: Iterable[str], k: int, *, key: None = None, reverse: bool = False
+    ) -> list[str]: ...
+    @overload
+    def top_k(
+        self, iterable: Iterable[T], k: int, *, key: Callable[[T], str], reverse: bool = False
+    ) -> list[T]: ...
+    @overload
+    def unique(self, iterable: Iterable[str], *, key: None = None) -> list[str]: ...
+    @overload
+    def unique(self, iterable: Iterable[T], *, key: Callable[[T], str]) -> list[T]: ...
+    def compare(self, a: str, b: str) -> Literal[-1, 0, 1]:
+        """Compare two strings.
+
+        Returns:
+            Literal[-1, 0, 1]: -1 if `a` sorts before `b`, 1 if after and 0 if they are equal.
+
+        """
+
+    def sort_key(self, value: str) -> SortKey:
+        """Get a key for `sorted`, `min`, `max` etc., e.g. `sorted(names, key=collator.sort_key)`.
+
+        The key compares by collating the strings, prefer `sort` to sort many strings.
+        """
+
+    def ranks(self, inputs: Sequence[str]) -> list[int]:
+        """Compute the dense rank of each string, see `uca_ranks`."""
+
+    @overload
+    def bisect_left(
+        self, a: Sequence[str], x: str, lo: int = 0, hi: int | None = None, *, key: None = None
+    ) -> int: ...
+    @overload
+    def bisect_left(
+        self,
+        a: Sequence[T],
+        x: str,
+        lo: int = 0,
+        hi: int | None = None,
+        *,
+        key: Callable[[T], str],
+    ) -> int: ...
+    @overload
+    def bisect_right(
+        self, a: Sequence[str], x: str, lo: int = 0, hi: int | None = None, *, key: None = None
+    ) -> int: ...
+    @overload
+    def bisect_right(
+        self,
+        a: Sequence[T],
+        x: str,
+        lo: int = 0,
+        hi: int | None = None,
+        *,
+        key: Callable[[T], str],
+    ) -> int: ...
+    @overload
+    def insort(
+        self,
+        a: MutableSequence[str],
+        x: str,
+        lo: int = 0,
+        hi: int | None = None,
+        *,
+        key: None = None,
+    ) -> int: ...
+    @overload
+    def insort(
+        self,
+        a: MutableSequence[T],
+        x: T,
+        lo: int = 0,
+        hi: int | None = None,
+        *,
+        key: Callable[[T], str],
+    ) -> int: ...
+    @overload
+    def prefix_range(
+        self, a: Sequence[str], prefix: str, *, key: None = None
+    ) -> tuple[int, int]: ...
+    @overload
+    def prefix_range(
+        self, a: Sequence[T], prefix: str, *, key: Callable[[T], str]
+    ) -> tuple[int, int]: ...
+    @overload
+    def merge(
+        self, *iterables: Iterable[str], key: None = None, reverse: bool = False
+    ) -> UcaMerge[str]: ...
+    @overload
+    def merge(
+        self, *iterables: Iterable[T], key: Callable[[T], str], reverse: bool = False
+    ) -> UcaMerge[T]: ...
+    @overload
+    def sorted_merge(
+        self, left: Iterable[str], right: Iterable[str], *, key: None = None
+    ) -> list[str]: ...
+    @overload
+    def sorted_merge(
+        self, left: Iterable[T], right: Iterable[T], *, key: Callable[[T], str]
+    ) -> list[T]: ...
+
+IDNOFields = tuple[str, str, str, int | None, str | None, int | None, int | None, str | None]
+
+def parse_idno(idno: str) -> IDNOFields:
+    """Parse an IDNO string without using regular expressions.
+
+    Implements the grammar of `ssrq_utils.idno.model.SCHEMA`.
+
+    Args:
+        idno (str): The IDNO string.
+
+    Returns:
+        IDNOFields: prefix, kanton, volume, case, opening, doc, num and special.
+
+    Raises:
+        ValueError: If the string does not match the schema.
+
+    """
+
+def parse_idnos(idnos: Sequence[str]) -> list[IDNOFields | None]:
+    """Parse many IDNO strings, the GIL is released while parsing.
+
+    Args:
+        idnos (Sequence[str]): The IDNO strings.
+
+    Returns:
+        list[IDNOFields | None]: The fields for each string, `None` if it does not match the schema.
+
+    """
@@ -0,0 +1,86 @@
+import pickle
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from itertools import islice
+from operator import itemgetter
+from typing import IO, Any, TypeVar
+
+from ssrq_utils.uca._pyferuca import uca_merge, uca_sort
+
+T = TypeVar("T")
+
+RUN_SIZE = 100_000
+
+
+def _write_run(run: list[tuple[Any, Any]]) -> IO[bytes]:
+    file = tempfile.TemporaryFile()  # noqa: SIM115 - closed by the caller
+    pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    for entry in run:
+        pickler.dump(entry)
+    file.seek(0)
+    return file
+
+
+def _read_run(file: IO[bytes]) -> Iterator[tuple[str, Any]]:
+    unpickler = pickle.Unpickler(file)
+    while True:
+        try:
+            yield unpickler.load()
+        except EOFError:
+            return
+
+
+def uca_external_sort(
+    iterable: Iterable[T],
+    *,
+    key: Callable[[T], str] | None = None,
+    reverse: bool = False,
+    run_size: int = RUN_SIZE,
+) -> Iterator[T]:
+    """Sort an iterable using the UCA within a bounded amount of memory.
+
+    At most `run_size` items are kept in memory: the items are sorted in
+    runs of this size, which are spilled to temporary files and lazily
+    merged with `uca_merge`. If all items fit into a single run, nothing
+    is written to disk. The items need to be picklable, the sort is
+    stable like `uca_sort` and the key function is called once per item.
+
+    Args:
+        iterable (Iterable[T]): The items to sort, e.g. a generator.
+        key (Callable[[T], str] | None): Returns the string to sort an item by,
+            the items themselves are used if omitted.
+        reverse (bool): Sort in descending order.
+        run_size (int): The maximum number of items sorted in memory at once.
+
+    Returns:
+        Iterator[T]: The sorted items, temporary files are removed once it is
+            exhausted or closed.
+
+    Raises:
+        ValueError: If `run_size` is not positive.
+
+    """
+    if run_size < 1:
+        raise ValueError(f"The run size must be positive, got {run_size}")
+
+    return _external_sort(iter(iterable), key, reverse, run_size)
+
+
+def _external_sort(
+    items: Iterator[T], key: Callable[[T], str] | None, reverse: bool, run_size: int
+) -> Iterator[T]:
+    # without a key, uca_sort rejects items, which are not strings
+    get_key: Callable[[T], Any] = key or (lambda item: item)
+    with ExitStack() as files:
+        runs: list[Iterator[tuple[str, T]]] = []
+        while run := [(get_key(item), item) for item in islice(items, run_size)]:
+            run = uca_sort(run, key=itemgetter(0), reverse=reverse)
+            if not runs and len(run) < run_size:
+                # everything fits into memory
+                yield from (item for _, item in run)
+                return
+            runs.append(_read_run(files.enter_context(_write_run(run))))
+
+        for _, item in uca_merge(*runs, key=itemgetter(0), reverse=reverse):
+            yield item
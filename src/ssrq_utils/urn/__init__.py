@@ -1,3 +1,10 @@
-from ssrq_utils.urn import model
+from typing import TYPE_CHECKING
 
-__all__ = ["model"]
+from ssrq_utils._lazy import attach
+
+if TYPE_CHECKING:
+    from ssrq_utils.urn import codec, index, model
+
+__all__ = ["codec", "index", "model"]
+
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -0,0 +1,86 @@
+from collections.abc import Iterable
+
+from ssrq_utils._codec import (
+    _CORRUPT,
+    _FRAGMENT,
+    _MODEL,
+    Buffer,
+    _decode,
+    _Encoder,
+    _read_fields,
+    _read_varint,
+)
+from ssrq_utils.idno.model import IDNO, IDNOFields
+from ssrq_utils.urn.model import URN
+
+MAGIC = b"SSRQURNS"
+
+
+def encode_urns(urns: Iterable[URN]) -> bytes:
+    """Encode a sequence of URNs into a compact binary buffer, see `idno.codec.encode_idnos`.
+
+    IDNOs given as models are stored by their fields, IDNOs given as
+    strings are stored verbatim in the string table, like the fragments.
+    So the decoded URNs are equal to the encoded ones, including IDNOs
+    that do not match the schema.
+
+    Args:
+        urns (Iterable[URN]): The URNs.
+
+    Returns:
+        bytes: The buffer, see `decode_urns`.
+
+    """
+    encoder = _Encoder()
+    for urn in urns:
+        if isinstance(urn.idno, IDNO):
+            encoder.add(urn.idno, _MODEL, urn.fragment)
+        else:
+            encoder.add_string(urn.idno, urn.fragment)
+    return encoder.build(MAGIC)
+
+
+def decode_urns(buffer: Buffer) -> list[URN]:
+    """Decode the URNs in a buffer created by `encode_urns`.
+
+    The buffer is read in place, e.g. from shared memory, and the URNs are
+    not validated again. Equal URNs share the same instance, IDNOs given as
+    strings are parsed on access of `URN.parsed_idno` as usual.
+
+    Args:
+        buffer (Buffer): The buffer.
+
+    Returns:
+        list[URN]: The URNs in their encoded order.
+
+    Raises:
+        ValueError: If the buffer was not created by `encode_urns`.
+
+    """
+    construct = URN._construct_unchecked
+    data, pos, count, strings = _decode(buffer, MAGIC)
+    instances: dict[tuple[IDNOFields | str, str | None], URN] = {}
+    urns: list[URN] = []
+
+    try:
+        for _ in range(count):
+            flags = data[pos]
+            # models are stored by their fields, strings verbatim
+            key: IDNOFields | str
+            if flags & _MODEL:
+                key, pos = _read_fields(data, pos + 1, flags, strings)
+            else:
+                index, pos = _read_varint(data, pos + 1)
+                key = strings[index]
+            fragment = None
+            if flags & _FRAGMENT:
+                index, pos = _read_varint(data, pos)
+                fragment = strings[index]
+            if (urn := instances.get((key, fragment))) is None:
+                idno = key if isinstance(key, str) else IDNO._construct_unchecked(key)
+                urn = instances[key, fragment] = construct(idno, fragment)
+            urns.append(urn)
+    except IndexError:
+        raise ValueError(_CORRUPT) from None
+
+    return urns
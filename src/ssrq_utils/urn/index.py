@@ -0,0 +1,165 @@
+from collections.abc import Hashable, Iterable, Iterator
+from types import MappingProxyType
+from typing import NamedTuple, cast
+
+from ssrq_utils.idno.index import AnyIDNO, IDNOIndex, IndexKey, index_key
+from ssrq_utils.idno.model import IDNO
+from ssrq_utils.urn.model import URN
+
+# the fragments of a target and the sources referencing each of them
+Fragments = MappingProxyType[str | None, frozenset[Hashable]]
+
+
+def _links(urns: Iterable[URN]) -> set[tuple[IDNO, str | None]]:
+    return {(urn.parsed_idno, urn.fragment) for urn in urns}
+
+
+class References(NamedTuple):
+    """The references into a single document."""
+
+    target: IDNO
+    fragments: Fragments
+
+
+class LinkIndex:
+    """A reverse index from IDNOs to the URNs referencing them, e.g. for "cited by" panels.
+
+    References are added per source, e.g. the IDNO of the referencing
+    document. Adding the same URN for a source twice has no effect.
+    The sources can be re-indexed one by one, e.g. after a volume has
+    changed, without rebuilding the whole index. The targets are kept
+    in the order of an `IDNOIndex`, so that all references into a volume
+    or a range of documents can be looked up. Their fragments are looked
+    up by the same `index_key`, so both always hold the same targets.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._targets = IDNOIndex()
+        self._fragments: dict[IndexKey, dict[str | None, set[Hashable]]] = {}
+        self._links: dict[Hashable, set[tuple[IDNO, str | None]]] = {}
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._targets)
+
+    def __iter__(self) -> Iterator[References]:  # noqa: D105
+        return (self._references(target) for target in self._targets)
+
+    def __contains__(self, idno: object) -> bool:  # noqa: D105
+        return idno in self._targets
+
+    @property
+    def sources(self) -> frozenset[Hashable]:
+        """The sources, which have been added to the index."""
+        return frozenset(self._links)
+
+    def add(self, source: Hashable, urns: Iterable[URN]) -> None:
+        """Add the references of a source.
+
+        Args:
+            source (Hashable): The referencing source, e.g. an IDNO string.
+            urns (Iterable[URN]): The URNs referenced by the source.
+
+        Raises:
+            ValueError: If the IDNO of a URN is invalid, the index is not changed in this case.
+
+        """
+        self._add(source, _links(urns))
+
+    def _add(self, source: Hashable, links: set[tuple[IDNO, str | None]]) -> None:
+        known = self._links.setdefault(source, set())
+        for target, fragment in links - known:
+            key = index_key(target)
+            if (fragments := self._fragments.get(key)) is None:
+                fragments = self._fragments[key] = {}
+                self._targets.add(target)
+            fragments.setdefault(fragment, set()).add(source)
+        known |= links
+
+    def remove(self, source: Hashable) -> None:
+        """Remove all references of a source.
+
+        Args:
+            source (Hashable): The referencing source.
+
+        """
+        for target, fragment in self._links.pop(source, ()):
+            key = index_key(target)
+            fragments = self._fragments[key]
+            sources = fragments[fragment]
+            sources.discard(source)
+            if sources:
+                continue
+            del fragments[fragment]
+            if not fragments:
+                del self._fragments[key]
+                self._targets.discard(target)
+
+    def replace(self, source: Hashable, urns: Iterable[URN]) -> None:
+        """Re-index a source, replacing its previous references.
+
+        Args:
+            source (Hashable): The referencing source.
+            urns (Iterable[URN]): The URNs now referenced by the source.
+
+        Raises:
+            ValueError: If the IDNO of a URN is invalid, the index is not changed in this case.
+
+        """
+        links = _links(urns)
+        self.remove(source)
+        self._add(source, links)
+
+    def references(self, idno: AnyIDNO) -> References | None:
+        """Get the references into a document.
+
+        Args:
+            idno (AnyIDNO): The referenced IDNO.
+
+        Returns:
+            References | None: The references or None if the document is not referenced.
+
+        """
+        target = idno if isinstance(idno, IDNO) else idno.to_model()
+        return self._references(target) if index_key(target) in self._fragments else None
+
+    def find(
+        self, prefix: str, kanton: str | None = None, volume: str | None = None
+    ) -> list[References]:
+        """Find all references into a prefix, a kanton or a volume, see `IDNOIndex.find`.
+
+        Args:
+            prefix (str): The prefix e.g. SSRQ.
+            kanton (str | None): The canton code, required if a volume is given.
+            volume (str | None): The volume.
+
+        Returns:
+            list[References]: The references per document in the order of the documents.
+
+        """
+        return [self._references(target) for target in self._targets.find(prefix, kanton, volume)]
+
+    def range(self, start: AnyIDNO, stop: AnyIDNO) -> list[References]:
+        """Find all references into the documents from `start` (inclusive) up to `stop` (exclusive).
+
+        Args:
+            start (AnyIDNO): The lower bound.
+            stop (AnyIDNO): The upper bound.
+
+        Returns:
+            list[References]: The references per document in the order of the documents.
+
+        """
+        return [self._references(target) for target in self._targets.range(start, stop)]
+
+    def _references(self, idno: AnyIDNO) -> References:
+        # only IDNO models are added to the targets
+        target = cast(IDNO, idno)
+        return References(
+            target,
+            MappingProxyType(
+                {
+                    fragment: frozenset(sources)
+                    for fragment, sources in self._fragments[index_key(target)].items()
+                }
+            ),
+        )
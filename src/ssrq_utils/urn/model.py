@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from functools import cached_property
 from typing import Self
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -22,8 +24,6 @@ class URN(BaseModel):
     ) -> Self:
         """Validate an urn string and return an instance of the model.
 
-        Note: The Hashing of the model is only possible if the idno is not cast to an IDNO instance.
-
         Args:
         ----
             idno: The urn string to validate.
@@ -39,14 +39,79 @@ class URN(BaseModel):
         if not idno.startswith(urn_prefix):
             raise ValueError(f"Invalid URN: '{idno}' expected to start with '{urn_prefix}'.")
 
-        idno = idno[len(urn_prefix) :]
-
-        if fragment_sep in idno:
-            idno, fragment = idno.split(fragment_sep)
-        else:
-            fragment = None
+        idno, sep, fragment = idno[len(urn_prefix) :].partition(fragment_sep)
 
         return cls(
             idno=idno_utils.model.IDNO.model_validate_string(idno=idno) if cast_to_idno else idno,
-            fragment=fragment,
+            fragment=fragment if sep else None,
         )
+
+    @classmethod
+    def model_validate_strings(  # type: ignore[override]
+        cls,
+        urns: Iterable[str],
+        urn_prefix: str = "urn:ssrq:",
+        fragment_sep: str = "#",
+    ) -> list[Self]:
+        """Validate many urn strings at once.
+
+        Checks the prefix and splits off the fragment in a single pass, the
+        IDNOs are kept as strings and only parsed on access of `parsed_idno`.
+        Strings occurring more than once share the same instance. Everything
+        after the first separator belongs to the fragment.
+
+        Note: Replaces pydantic's `model_validate_strings`, which is of no
+        use for this model.
+
+        Args:
+        ----
+            urns: The urn strings to validate.
+            urn_prefix: The prefix that the URNs should start with.
+            fragment_sep: The separator that separates the idno from the fragment.
+
+        Returns:
+        -------
+            The instances in the order of the strings.
+
+        """
+        start = len(urn_prefix)
+        instances: dict[str, Self] = {}
+        parsed: list[Self] = []
+
+        for urn in urns:
+            if (instance := instances.get(urn)) is None:
+                if not urn.startswith(urn_prefix):
+                    raise ValueError(f"Invalid URN: '{urn}' expected to start with '{urn_prefix}'.")
+                idno, sep, fragment = urn[start:].partition(fragment_sep)
+                instance = instances[urn] = cls.model_construct(
+                    idno=idno, fragment=fragment if sep else None
+                )
+            parsed.append(instance)
+
+        return parsed
+
+    @classmethod
+    def _construct_unchecked(cls, idno: idno_utils.model.IDNO | str, fragment: str | None) -> Self:
+        """Create an instance from already validated fields, bypassing pydantic."""
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", {"idno": idno, "fragment": fragment})
+        object.__setattr__(instance, "__pydantic_fields_set__", {"idno", "fragment"})
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    @cached_property
+    def parsed_idno(self) -> idno_utils.model.IDNO:
+        """Get the IDNO of the URN as an IDNO instance.
+
+        Parsed on first access (using the shared `idno.cache.IDNO_CACHE`)
+        and cached afterwards, the URN stays hashable.
+
+        Raises
+        ------
+            ValueError: If the IDNO does not match the schema.
+
+        """
+        if isinstance(self.idno, idno_utils.model.IDNO):
+            return self.idno
+        return idno_utils.cache.validate_string(self.idno)
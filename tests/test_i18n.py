@@ -1,10 +1,20 @@
 import json
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from ssrq_utils.i18n.catalog import Catalog, build_catalog, compile_catalog, is_catalog
+from ssrq_utils.i18n.error import I18nValidationError
 from ssrq_utils.i18n.model import I18nMap
-from ssrq_utils.i18n.text import normalize_punctuation_marks
+from ssrq_utils.i18n.text import (
+    create_punctuation_mark,
+    iter_normalized_punctuation_marks,
+    normalize_punctuation_marks,
+)
 from ssrq_utils.i18n.translator import Translator
 from ssrq_utils.lang.display import Lang
 
@@ -42,6 +52,27 @@ def test_model_raises_error_on_different_number_of_translations():
         I18nMap.model_validate(invalid_translations)
 
 
+def test_model_reports_different_keys():
+    invalid_translations = {
+        "de": {"foo": "bar", "baz": "qux"},
+        "en": {"foo": "bar", "baz": "qux"},
+        "fr": {"foo": "bar", "qux": "baz"},
+        "it": {"foo": "bar"},
+    }
+
+    with pytest.raises(ValueError, match="»fr« is missing the keys 'baz'") as error:
+        I18nMap.model_validate(invalid_translations)
+    assert "»fr« has the additional keys 'qux'" in str(error.value)
+    assert "»it« is missing the keys 'baz'" in str(error.value)
+    assert "»en«" not in str(error.value)
+
+
+def test_model_limits_reported_keys():
+    keys = {f"key{i:02}": "value" for i in range(15)}
+    with pytest.raises(ValueError, match=r"'key09' \(and 5 more\)"):
+        I18nMap.model_validate({"de": keys, "en": keys, "fr": keys, "it": {}})
+
+
 def test_translator_can_be_created(translation_file: Path):
     translator = Translator(translation_file)
     assert translator is not None
@@ -63,13 +94,213 @@ def test_translator_can_translate(translation_file: Path, lang: Lang, key: str,
     assert translator.translate(lang, key) == expected
 
 
+def test_translator_translates_many(translation_file: Path):
+    translator = Translator(translation_file)
+    assert translator.translate_many(Lang.IT, ["foo", "baz"]) == ["bar", "Unknown key: 'baz'"]
+    assert translator.translate_many("xx", ["foo"]) == ["Unknown language: 'xx'"]  # type: ignore[arg-type]
+    assert translator.translate("xx", "foo") == "Unknown language: 'xx'"  # type: ignore[arg-type]
+
+
+def test_translator_bundle(translation_file: Path):
+    bundle = Translator(translation_file).bundle(Lang.EN)
+    assert dict(bundle) == {"foo": "bar"}
+    with pytest.raises(TypeError):
+        bundle["foo"] = "baz"  # type: ignore[index]
+
+
+def test_translator_is_shared_per_source(
+    tmp_path: Path, translation_file: Path, valid_translations: dict[str, dict[str, str]]
+):
+    other_file = tmp_path / "other.json"
+    other_file.write_text(json.dumps({lang: {"foo": "qux"} for lang in valid_translations}))
+
+    assert Translator(translation_file) is Translator(translation_file)
+    assert Translator(other_file) is not Translator(translation_file)
+    assert Translator(other_file).translate(Lang.DE, "foo") == "qux"
+    assert Translator(translation_file).translate(Lang.DE, "foo") == "bar"
+
+
+def test_translator_loads_once(monkeypatch: pytest.MonkeyPatch, translation_file: Path):
+    loaded = []
+    load_translations = Translator._load_translations
+
+    def spy(translator: Translator, translation_source: Path) -> I18nMap | Catalog:
+        loaded.append(translation_source)
+        return load_translations(translator, translation_source)
+
+    monkeypatch.setattr(Translator, "_load_translations", spy)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        instances = set(pool.map(lambda _: id(Translator(translation_file)), range(32)))
+    assert len(instances) == 1
+    assert loaded == [translation_file.resolve()]
+
+
+def test_translator_namespaces(tmp_path: Path, translation_file: Path):
+    Translator.register("frontend", translation_file)
+    Translator.register("frontend", translation_file)
+    assert Translator.for_namespace("frontend") is Translator(translation_file)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        Translator.register("frontend", tmp_path / "other.json")
+    with pytest.raises(KeyError):
+        Translator.for_namespace("unknown")
+
+
+def _rewrite(path: Path, translations: dict[str, dict[str, str]]) -> None:
+    stat = path.stat()
+    path.write_text(json.dumps(translations))
+    # make sure the change is visible on file systems with a coarse mtime
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_translator_reloads(translation_file: Path):
+    translator = Translator(translation_file)
+    assert translator.translate(Lang.DE, "foo") == "bar"
+    assert translator.translate(Lang.EN, "foo") == "bar"
+    assert not translator.reload()
+
+    _rewrite(
+        translation_file,
+        {lang: {"foo": "qux" if lang == "de" else "bar"} for lang in ("de", "en", "fr", "it")},
+    )
+    assert translator.reload()
+    assert translator.translate(Lang.DE, "foo") == "qux"
+    assert translator.translate(Lang.EN, "foo") == "bar"
+
+    translation_file.write_text("{")
+    with pytest.raises(ValueError):  # noqa: PT011
+        translator.reload(force=True)
+    assert translator.translate(Lang.DE, "foo") == "qux"
+
+
+def test_translator_watches(
+    caplog: pytest.LogCaptureFixture,
+    translation_file: Path,
+    valid_translations: dict[str, dict[str, str]],
+):
+    def wait_for(condition: Callable[[], bool]) -> bool:
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    translator = Translator(translation_file)
+    translator.watch(interval=0.01)
+    try:
+        translation_file.write_text("{")
+        assert wait_for(lambda: "Reloading the translations" in caplog.text)
+        assert translator.translate(Lang.FR, "foo") == "bar"
+
+        _rewrite(translation_file, {lang: {"foo": "qux"} for lang in valid_translations})
+        assert wait_for(lambda: translator.translate(Lang.FR, "foo") == "qux")
+    finally:
+        translator.unwatch()
+
+
+def test_translator_loads_catalog(tmp_path: Path, translation_file: Path):
+    catalog_file = tmp_path / "translations.catalog"
+    compile_catalog(translation_file, catalog_file)
+    translator = Translator(catalog_file)
+    assert isinstance(translator.translations, Catalog)
+    assert translator.translate(Lang.FR, "foo") == "bar"
+    assert translator.translate(Lang.FR, "baz") == "Unknown key: 'baz'"
+
+
+def test_catalog(tmp_path: Path, translation_file: Path):
+    catalog_file = tmp_path / "translations.catalog"
+    compile_catalog(translation_file, catalog_file)
+    assert is_catalog(catalog_file)
+    assert not is_catalog(translation_file)
+
+    catalog = Catalog.open(catalog_file)
+    assert len(catalog) == 1
+    assert dict(catalog.de) == {"foo": "bar"}
+    assert catalog.it["foo"] == "bar"
+    assert catalog.fr.get("baz") is None
+
+
+def test_catalog_lookup():
+    translations = {
+        "de": {key: f"{key} (de)" for key in ("b", "a", "ä", "c")},
+        "en": {key: f"{key} (en)" for key in ("b", "a", "ä", "c")},
+        "fr": dict.fromkeys(("b", "a", "ä", "c"), "même"),
+        "it": {key: f"{key} (it)" for key in ("b", "a", "ä", "c")},
+    }
+    catalog = Catalog(build_catalog(I18nMap.model_validate(translations)))
+    for lang, expected in translations.items():
+        assert dict(getattr(catalog, lang)) == expected
+    assert list(catalog.en) == ["a", "b", "c", "ä"]
+    assert catalog.index("ab") == -1
+    assert catalog.index("z") == -1
+
+
+def test_catalog_lookup_with_many_keys():
+    keys = sorted(f"key.{i}" for i in range(1000))
+    column = {key: key.upper() for key in keys}
+    catalog = Catalog(build_catalog(I18nMap(de=column, en=column, fr=column, it=column)))
+
+    # the keys collide in the hash table and are found by probing
+    assert [catalog.index(key) for key in keys] == list(range(len(keys)))
+    assert all(catalog.de[key] == key.upper() for key in keys)
+    assert catalog.index("key.1000") == -1
+    assert Catalog(build_catalog(I18nMap(de={}, en={}, fr={}, it={}))).index("key") == -1
+
+
+def test_catalog_rejects_other_files():
+    with pytest.raises(I18nValidationError):
+        Catalog(b"{" * 16)
+    with pytest.raises(I18nValidationError):
+        Catalog(b"{")
+
+
+def test_catalog_rejects_truncated_files(tmp_path: Path, translation_file: Path):
+    catalog_file = tmp_path / "translations.catalog"
+    compile_catalog(translation_file, catalog_file)
+    catalog = catalog_file.read_bytes()
+
+    translator = Translator(catalog_file)
+
+    for size in (30, len(catalog) - 1):
+        with pytest.raises(I18nValidationError, match="truncated"):
+            Catalog(catalog[:size])
+    # replaced like `compile_catalog` does, the current catalog maps the old file
+    truncated_file = tmp_path / "truncated.catalog"
+    truncated_file.write_bytes(catalog[:-1])
+    os.replace(truncated_file, catalog_file)
+    with pytest.raises(I18nValidationError, match="truncated"):
+        translator.reload(force=True)
+    assert translator.translate(Lang.FR, "foo") == "bar"
+
+
 @pytest.mark.parametrize(
     ("lang", "text", "expected"),
     [
         (Lang.DE, "foo: bar", "foo: bar"),
         (Lang.EN, "foo: bar", "foo: bar"),
         (Lang.FR, "foo: bar", "foo : bar"),
+        (Lang.DE, "foo ? bar  !", "foo? bar!"),
+        (Lang.FR, "foo;bar \n?", "foo ;bar ?"),
     ],
 )
 def test_normalize_punctuation_mark(lang: Lang, text: str, expected: str):
     assert normalize_punctuation_marks(text, lang) == expected
+
+
+@pytest.mark.parametrize("lang", list(Lang))
+@pytest.mark.parametrize("mark", [":", "?", ";", "!"])
+def test_normalize_punctuation_mark_matches_create_punctuation_mark(lang: Lang, mark: str):
+    assert (
+        normalize_punctuation_marks(f"foo  {mark}", lang)
+        == f"foo{create_punctuation_mark(mark, lang)}"
+    )
+
+
+@pytest.mark.parametrize("lang", [Lang.DE, Lang.FR])
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_iter_normalized_punctuation_marks(lang: Lang, size: int):
+    text = "Article premier:  la ville ; \n ! et  ?le lac  \t"
+    chunks = [text[i : i + size] for i in range(0, len(text), size)]
+    result = list(iter_normalized_punctuation_marks(iter(chunks), lang))
+    assert len(result) == len(chunks)
+    assert "".join(result) == normalize_punctuation_marks(text, lang)
+    assert list(iter_normalized_punctuation_marks([], lang)) == []
@@ -1,6 +1,9 @@
+import re
+import tracemalloc
+
 import pytest
 
-from ssrq_utils.idno import filter, model
+from ssrq_utils.idno import cache, codec, columnar, compact, filter, index, model, volume
 
 
 @pytest.mark.parametrize(
@@ -80,6 +83,48 @@ def test_print_volume(idno: model.IDNO, expected: str):
     assert idno.print_volume() == expected
 
 
+def test_idnos_share_volumes():
+    first = model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1_3-1-1")
+    (second,) = model.IDNO.model_validate_strings(["SSRQ-ZH-NF_I_1_3-2-1"]).idnos
+    third = compact.CompactIDNO.from_string("SSRQ-ZH-NF_I_1_3-3-1")
+
+    assert first.volume_info is second.volume_info is third.volume_info
+    assert first.volume is second.volume is third.volume is first.volume_info.name
+    (decoded,) = codec.decode_idnos(codec.encode_idnos([second]))
+    assert decoded.volume is first.volume
+    assert first.volume_info == ("NF_I_1_3", "NF I/1/3", ((1, "NF"), (0, 1), (0, 1), (0, 3)))
+    assert "NF_I_1_3" in volume.VOLUMES
+
+
+def test_print_volume_follows_copies():
+    (idno,) = model.IDNO.model_validate_strings(["SSRQ-ZH-NF_I_1-1-1"]).idnos
+    assert idno.print_volume() == "NF I/1"
+
+    copy = idno.model_copy(update={"volume": "B_2"})
+    assert copy.print_volume() == "B 2"
+    assert copy.volume_info.name == "B_2"
+    assert idno.model_fields_set == copy.model_fields_set == set(model._FIELD_NAMES)
+
+
+def test_volume_registry_sorts_naturally():
+    registry = volume.VolumeRegistry()
+    names = ["I_10", "IV_1", "NF_I_1", "I_2", "IX", "B", "II_1"]
+    entries = [registry.intern(name) for name in names]
+
+    assert len(registry) == len(names)
+    assert list(registry) == entries
+    assert registry.intern("I_2") is entries[3]
+    assert [entry.name for entry in registry.sorted()] == [
+        "I_2",
+        "I_10",
+        "II_1",
+        "IV_1",
+        "IX",
+        "B",
+        "NF_I_1",
+    ]
+
+
 @pytest.mark.parametrize(
     ("idno", "expected"),
     [
@@ -134,3 +179,454 @@ def test_get_main_idnos():
 
     assert filtered_idnos is not None
     assert len(filtered_idnos) == len(inputs) - 1
+
+
+def test_idno_model_validate_strings():
+    inputs = [
+        "SSRQ-SG-III_4-58-1",
+        "SSRQ-FR-I_2_8-2.0-1",
+        "SSRQ-SG-III_4-58-1.0-1",  # invalid
+        "SDS-NE-4-1.A.1-1",
+        "SSRQ-ZH-NF_I_1-lit",
+        "SSRQ-SG-III_4-58-1",
+    ]
+
+    idnos, errors = model.IDNO.model_validate_strings(inputs)
+
+    assert idnos == [model.IDNO.model_validate_string(i) for i in inputs if i != inputs[2]]
+    assert [idno.model_fields_set for idno in idnos] == [
+        model.IDNO.model_validate_string(i).model_fields_set for i in inputs if i != inputs[2]
+    ]
+    assert idnos[0] is idnos[-1]
+    assert len(errors) == 1
+    assert errors[0].position == inputs.index("SSRQ-SG-III_4-58-1.0-1")
+    assert errors[0].value == inputs[2]
+
+
+def test_idno_model_validate_strings_with_custom_schema():
+    inputs = ["SSRQ-SG-III_4-58-1", "SDS-NE-4-1.A.1-1", "SSRQ-SG-III_4-58-2"]
+
+    idnos, errors = model.IDNO.model_validate_strings(inputs, schema=re.compile(model.SCHEMA))
+
+    assert idnos == model.IDNO.model_validate_strings(inputs).idnos
+    assert [e.position for e in errors] == [2]
+
+
+@pytest.mark.parametrize(
+    "idno",
+    [
+        "SSRQ-SG-III_4-58-1",
+        "SSRQ-FR-I_2_8-2.0-1",
+        "SDS-NE-4-1.A.1-1",
+        "SDS-NE-4-1.2.3-1",
+        "SSRQ-ZH-NF_I_1-lit",
+        "FDS-VD-D_1-bailiffs",
+        "SSRQ-SG-III_4-58-1.0-1",
+        "SSRQ-SG-III_4-58-2",
+        "SSRQ-sg-III_4-58-1",
+        "SSRQ-SG-III_4-.1-1",
+        "SSRQ-SG-III_4-1..1-1",
+        "SSRQ-SG-III_4-1.a-1",
+        "SSRQ-SG-III_4-litx",
+        "SSRQ-SG-III_4",
+    ],
+)
+def test_native_idno_parser_matches_schema(idno: str):
+    native = pytest.importorskip("ssrq_utils.uca._pyferuca")
+    assert native.parse_idnos([idno]) == model._parse_fields([idno])
+
+
+def test_strings_rejected_by_the_native_parser_are_checked_against_the_schema(monkeypatch):
+    def reject(idno: str):
+        raise ValueError(idno)
+
+    monkeypatch.setattr(model, "_native_parse_idno", reject)
+    monkeypatch.setattr(model, "_native_parse_idnos", lambda idnos: [None] * len(idnos))
+    idno = "SSRQ-ZH-A-99999999999999999999999-1"
+
+    assert repr(model.IDNO.model_validate_string(idno)) == idno
+    batch = model.IDNO.model_validate_strings([idno, "SSRQ-ZH-A-1-1\n", "SSRQ-ZH-A"])
+    assert [repr(i) for i in batch.idnos] == [idno, "SSRQ-ZH-A-1-1"]
+    assert [e.position for e in batch.errors] == [2]
+    with pytest.raises(ValueError, match="does not match the schema"):
+        model.IDNO.model_validate_string("SSRQ-ZH-A")
+
+
+@pytest.mark.parametrize(
+    "idno",
+    [
+        "SSRQ-SG-III_4-58-1",
+        "SSRQ-FR-I_2_8-2.0-1",
+        "SSRQ-FR-I_2_8-2.1-1",
+        "SDS-NE-4-1.A.1-1",
+        "SDS-VD-D_1-1-1",
+        "SSRQ-ZH-NF_I_1-lit",
+    ],
+)
+def test_compact_idno_behaves_like_model(idno: str):
+    model_instance = model.IDNO.model_validate_string(idno)
+    compact_instance = compact.CompactIDNO.from_string(idno)
+
+    assert compact_instance.sort_key == model_instance.sort_key
+    assert compact_instance.normalized_sort_key == model_instance.normalized_sort_key
+    assert compact_instance.is_main() == model_instance.is_main()
+    assert compact_instance.print_volume() == model_instance.print_volume()
+    assert repr(compact_instance) == repr(model_instance) == idno
+    assert compact_instance.to_model() == model_instance
+    assert compact.CompactIDNO.from_model(model_instance) == compact_instance
+    assert hash(compact_instance) == hash(compact.CompactIDNO.from_string(idno))
+
+
+def test_compact_idno_fails_for_invalid_idno():
+    with pytest.raises(ValueError):  # noqa: PT011
+        compact.CompactIDNO.from_string("SSRQ-SG-III_4-58-1.0-1")
+
+
+def test_compact_idno_uses_less_memory():
+    inputs = [f"SSRQ-ZH-NF_I_1-{case}.{doc}-1" for case in range(1, 51) for doc in range(20)]
+
+    def measure(factory):
+        tracemalloc.start()
+        instances = factory(inputs)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(instances) == len(inputs)
+        return size
+
+    model_size = measure(lambda values: model.IDNO.model_validate_strings(values).idnos)
+    compact_size = measure(compact.CompactIDNO.from_strings)
+
+    assert compact_size * 3 < model_size
+
+
+def test_idno_is_hashable():
+    idno = model.IDNO.model_validate_string("SSRQ-SG-III_4-58-1")
+    assert idno.sort_key
+    assert {idno: 1}[model.IDNO.model_validate_strings(["SSRQ-SG-III_4-58-1"]).idnos[0]] == 1
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        idno.doc = 1  # type: ignore[misc]
+
+
+def test_idno_cache_interns_instances():
+    idno_cache = cache.IDNOCache(maxsize=2)
+
+    first = idno_cache.get("SSRQ-SG-III_4-58-1")
+    assert idno_cache.get("SSRQ-SG-III_4-58-1") is first
+    idno_cache.get("SSRQ-FR-I_2_8-2.0-1")
+    idno_cache.get("SDS-NE-4-1.0-1")  # evicts the first entry
+
+    assert idno_cache.get("SSRQ-SG-III_4-58-1") is not first
+    assert idno_cache.info() == cache.CacheInfo(hits=1, misses=4, maxsize=2, size=2)
+
+    idno_cache.resize(1)
+    assert idno_cache.info().size == 1
+    assert idno_cache.get("SSRQ-SG-III_4-58-1") is idno_cache.get("SSRQ-SG-III_4-58-1")
+
+    idno_cache.clear()
+    assert idno_cache.info() == cache.CacheInfo(hits=0, misses=0, maxsize=1, size=0)
+
+
+def test_idno_cache_does_not_cache_invalid_idnos():
+    with pytest.raises(ValueError):  # noqa: PT011
+        cache.validate_string("SSRQ-SG-III_4-58-1.0-1")
+    assert cache.validate_string("SSRQ-SG-III_4-58-1") is cache.IDNO_CACHE.get("SSRQ-SG-III_4-58-1")
+
+
+@pytest.mark.parametrize(
+    ("smaller", "greater"),
+    [
+        ("SSRQ-FR-I_2_8-2.9-1", "SSRQ-FR-I_2_8-2.10-1"),
+        ("SSRQ-FR-I_2_8-2.0-1", "SSRQ-FR-I_2_8-2.1-1"),
+        ("SSRQ-FR-I_2_8-2.99-1", "SSRQ-FR-I_2_8-3.0-1"),
+        ("SSRQ-SG-III_4-9-1", "SSRQ-SG-III_4-10-1"),
+    ],
+)
+def test_int_sort_key(smaller: str, greater: str):
+    assert (
+        model.IDNO.model_validate_string(smaller).int_sort_key
+        < model.IDNO.model_validate_string(greater).int_sort_key
+    )
+    assert (
+        compact.CompactIDNO.from_string(smaller).int_sort_key
+        < compact.CompactIDNO.from_string(greater).int_sort_key
+    )
+
+
+@pytest.fixture
+def idno_index():
+    return index.IDNOIndex(
+        model.IDNO.model_validate_strings(
+            [
+                "SSRQ-ZH-NF_I_1-2.10-1",
+                "SSRQ-ZH-NF_I_1-2.9-1",
+                "SSRQ-ZH-NF_I_1-2.0-1",
+                "SSRQ-ZH-NF_I_1-1-1",
+                "SSRQ-ZH-NF_I_2-1-1",
+                "SSRQ-SG-III_4-58-1",
+                "SDS-NE-4-1.0-1",
+                "SSRQ-ZH-NF_I_1-1-1",
+            ]
+        ).idnos
+    )
+
+
+def test_idno_index_is_sorted(idno_index: index.IDNOIndex):
+    assert [repr(idno) for idno in idno_index] == [
+        "SDS-NE-4-1.0-1",
+        "SSRQ-SG-III_4-58-1",
+        "SSRQ-ZH-NF_I_1-1-1",
+        "SSRQ-ZH-NF_I_1-2.0-1",
+        "SSRQ-ZH-NF_I_1-2.9-1",
+        "SSRQ-ZH-NF_I_1-2.10-1",
+        "SSRQ-ZH-NF_I_2-1-1",
+    ]
+
+
+def test_idno_index_keeps_openings_together():
+    strings = [
+        "SDS-NE-4-1.A.5-1",
+        "SDS-NE-4-10.A.1-1",
+        "SDS-NE-4-2.B.1-1",
+        "SDS-NE-4-1.A.1-1",
+        "SDS-NE-4-3-1",
+    ]
+    expected = [
+        "SDS-NE-4-3-1",
+        "SDS-NE-4-1.A.1-1",
+        "SDS-NE-4-1.A.5-1",
+        "SDS-NE-4-2.B.1-1",
+        "SDS-NE-4-10.A.1-1",
+    ]
+
+    assert [repr(i) for i in index.IDNOIndex(compact.CompactIDNO.from_strings(strings))] == expected
+    assert [strings[i] for i in columnar.to_columns(strings).argsort()] == expected
+
+
+def test_idno_index_keeps_idnos_with_equal_int_sort_keys():
+    strings = ["SSRQ-ZH-A-5.0-1", "SSRQ-ZH-A-0.5-1", "SSRQ-ZH-A-5-1", "SSRQ-ZH-A-6-1"]
+    idnos = model.IDNO.model_validate_strings(strings).idnos
+    idno_index = index.IDNOIndex(idnos[:2])
+
+    assert idnos[0].int_sort_key == idnos[1].int_sort_key == idnos[2].int_sort_key
+    assert list(idno_index) == [idnos[1], idnos[0]]
+    assert idno_index.add(idnos[2])
+    assert not idno_index.add(idnos[2])
+    assert idnos[2] in idno_index
+    assert [repr(i) for i in idno_index] == [
+        "SSRQ-ZH-A-0.5-1",
+        "SSRQ-ZH-A-5-1",
+        "SSRQ-ZH-A-5.0-1",
+    ]
+    assert idno_index.discard(idnos[0])
+    assert list(idno_index) == [idnos[1], idnos[2]]
+    assert idnos[3] not in idno_index
+
+
+def test_int_sort_key_is_not_serialized():
+    idno = model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-2.10-1")
+
+    assert idno.int_sort_key == 2 << 32 | 10
+    assert "int_sort_key" not in idno.model_dump()
+
+
+def test_idno_index_add_and_discard(idno_index: index.IDNOIndex):
+    idno = compact.CompactIDNO.from_string("SSRQ-ZH-NF_I_1-2.5-1")
+
+    assert idno_index.add(idno)
+    assert not idno_index.add(model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-2.5-1"))
+    assert idno in idno_index
+    assert "SSRQ-ZH-NF_I_1-2.5-1" not in idno_index
+    assert [repr(i) for i in idno_index.find("SSRQ", "ZH", "NF_I_1")][2:4] == [
+        "SSRQ-ZH-NF_I_1-2.5-1",
+        "SSRQ-ZH-NF_I_1-2.9-1",
+    ]
+
+    assert idno_index.discard(idno)
+    assert not idno_index.discard(idno)
+    assert idno not in idno_index
+
+
+def test_idno_index_find(idno_index: index.IDNOIndex):
+    assert idno_index.find("SSRQ") == list(idno_index)[1:]
+    assert idno_index.find("SSRQ", "ZH") == list(idno_index)[2:]
+    assert [repr(i) for i in idno_index.find("SSRQ", "ZH", "NF_I_2")] == ["SSRQ-ZH-NF_I_2-1-1"]
+    assert idno_index.find("FDS") == []
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        idno_index.find("SSRQ", volume="NF_I_1")
+
+
+def test_idno_index_range(idno_index: index.IDNOIndex):
+    start = model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-2.0-1")
+    stop = model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-2.10-1")
+
+    assert [repr(i) for i in idno_index.range(start, stop)] == [
+        "SSRQ-ZH-NF_I_1-2.0-1",
+        "SSRQ-ZH-NF_I_1-2.9-1",
+    ]
+
+
+def test_idno_index_neighbours(idno_index: index.IDNOIndex):
+    idno = model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-2.9-1")
+
+    assert repr(idno_index.predecessor(idno)) == "SSRQ-ZH-NF_I_1-2.0-1"
+    assert repr(idno_index.successor(idno)) == "SSRQ-ZH-NF_I_1-2.10-1"
+    assert idno_index.predecessor(model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-1-1")) is None
+    assert idno_index.successor(model.IDNO.model_validate_string("SSRQ-ZH-NF_I_1-2.10-1")) is None
+
+
+def test_iter_main_idnos_is_lazy():
+    inputs = (
+        model.IDNO.model_validate_string(idno)
+        for idno in ["SSRQ-FR-I_2_8-2.0-1", "SSRQ-FR-I_2_8-2.2-1", "SSRQ-SG-III_4-58-1"]
+    )
+
+    filtered_idnos = filter.iter_main_idnos(inputs)
+
+    assert repr(next(filtered_idnos)) == "SSRQ-FR-I_2_8-2.0-1"
+    assert repr(next(filtered_idnos)) == "SSRQ-SG-III_4-58-1"
+    assert filter.get_main_idnos([]) is None
+
+
+def test_group_by_case():
+    inputs = compact.CompactIDNO.from_strings(
+        [
+            "SSRQ-FR-I_2_8-1-1",
+            "SSRQ-FR-I_2_8-2.0-1",
+            "SSRQ-FR-I_2_8-2.1-1",
+            "SSRQ-FR-I_2_8-2.2-1",
+            "SSRQ-FR-I_2_8-3.1-1",
+            "SSRQ-FR-I_2_8-4-1",
+        ]
+    )
+
+    groups = [
+        (repr(main), [repr(doc) for doc in documents])
+        for main, documents in filter.group_by_case(iter(inputs))
+    ]
+
+    assert groups == [
+        ("SSRQ-FR-I_2_8-1-1", []),
+        ("SSRQ-FR-I_2_8-2.0-1", ["SSRQ-FR-I_2_8-2.1-1", "SSRQ-FR-I_2_8-2.2-1"]),
+        ("SSRQ-FR-I_2_8-3.1-1", []),
+        ("SSRQ-FR-I_2_8-4-1", []),
+    ]
+    assert list(filter.group_by_case([])) == []
+
+
+def test_to_columns():
+    strings = [
+        "SSRQ-ZH-NF_I_1-2.10-1",
+        "SSRQ-ZH-NF_I_1-2.9-1",
+        "SDS-NE-4-1.A.1-1",
+        "SSRQ-ZH-NF_I_1-lit",
+    ]
+    inputs = [
+        strings[0],
+        model.IDNO.model_validate_string(strings[1]),
+        compact.CompactIDNO.from_string(strings[2]),
+        strings[3],
+    ]
+
+    columns = columnar.to_columns(inputs)
+
+    assert len(columns) == len(inputs)
+    assert columns.prefix.categories == ["SDS", "SSRQ"]
+    assert list(columns.prefix.codes) == [1, 1, 0, 1]
+    assert columns.opening.categories == ["1.A"]
+    assert list(columns.opening.codes) == [-1, -1, 0, -1]
+    assert list(columns.case.values) == [2, 2, 0, 0]
+    assert list(columns.case.mask) == [0, 0, 1, 1]
+    assert list(columns.special.codes) == [-1, -1, -1, 0]
+    assert list(columns.sort_key) == [
+        compact.CompactIDNO.from_string(i).int_sort_key for i in strings
+    ]
+    assert [strings[i] for i in columns.argsort()] == [
+        repr(i) for i in index.IDNOIndex(compact.CompactIDNO.from_strings(strings))
+    ]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+# the largest case and document need more than 63 bits together with the other columns
+@pytest.mark.parametrize(("case", "doc"), [(2, 10), ((1 << 31) - 1, (1 << 32) - 1)])
+def test_columns_argsort(monkeypatch, numpy: bool, case: int, doc: int):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "np", None)
+    strings = [
+        f"SSRQ-ZH-NF_I_1-{case}.{doc}-1",
+        "SSRQ-ZH-NF_I_1-lit",
+        "SDS-NE-4-2.B.1-1",
+        f"SSRQ-ZH-NF_I_1-{case}.9-1",
+        "SSRQ-ZH-NF_I_1-1-1",
+        "SDS-NE-4-1.A.5-1",
+        "SSRQ-ZH-NF_I_1-1-1",
+        "SDS-NE-4-1.A.1-1",
+        "SDS-NE-4-10.A.1-1",
+        "SSRQ-ZH-NF_I_1-5.0-1",
+        "SSRQ-ZH-NF_I_1-0.5-1",
+        "SSRQ-ZH-NF_I_1-5-1",
+    ]
+
+    assert [strings[i] for i in columnar.to_columns(strings).argsort()] == sorted(
+        strings, key=lambda i: index.index_key(compact.CompactIDNO.from_string(i))
+    )
+    assert len(columnar.to_columns([]).argsort()) == 0
+    compacts = compact.CompactIDNO.from_strings(strings)
+    assert list(columnar.to_columns(compacts).argsort()) == list(
+        columnar.to_columns(strings).argsort()
+    )
+
+
+def test_to_columns_fails_for_invalid_idno():
+    with pytest.raises(ValueError):  # noqa: PT011
+        columnar.to_columns(["SSRQ-SG-III_4-58-1.0-1"])
+
+
+def test_codec_round_trip():
+    strings = [
+        "SSRQ-SG-III_4-58-1",
+        "SSRQ-FR-I_2_8-2.0-1",
+        "SDS-NE-4-1.A.1-1",
+        "SSRQ-ZH-NF_I_1-lit",
+        "SSRQ-SG-III_4-58-1",
+        "SSRQ-SG-III_4-1000.70000-1",
+    ]
+    idnos = model.IDNO.model_validate_strings(strings).idnos
+    buffer = codec.encode_idnos(idnos)
+
+    decoded = codec.decode_idnos(buffer)
+    assert decoded == idnos
+    assert decoded[0] is decoded[4]
+    assert [repr(idno) for idno in decoded] == strings
+    assert codec.decode_compact_idnos(buffer) == compact.CompactIDNO.from_strings(strings)
+    assert codec.encode_idnos(compact.CompactIDNO.from_strings(strings)) == buffer
+    assert codec.decode_idnos(memoryview(b"padding" + buffer)[7:]) == idnos
+    assert codec.decode_idnos(codec.encode_idnos([])) == []
+
+
+def test_codec_fails_for_invalid_buffers():
+    buffer = codec.encode_idnos(model.IDNO.model_validate_strings(["SSRQ-SG-III_4-58-1"]).idnos)
+
+    with pytest.raises(ValueError, match="too short"):
+        codec.decode_idnos(buffer[:4])
+    with pytest.raises(ValueError, match="not created by this codec"):
+        codec.iter_idno_fields(b"SSRQURNS" + buffer[8:])
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        codec.decode_idnos(buffer[:-1])
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        codec.decode_idnos(buffer[:30])
+
+    # the records are read on demand, so the complete ones are returned first
+    fields = codec.iter_idno_fields(
+        codec.encode_idnos(
+            compact.CompactIDNO.from_strings(["SSRQ-SG-III_4-58-1", "SSRQ-SG-III_4-59-1"])
+        )[:-1]
+    )
+    assert next(fields) == ("SSRQ", "SG", "III_4", None, None, 58, 1, None)
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        next(fields)
+    with pytest.raises(ValueError, match="non-negative"):
+        codec.encode_idnos([compact.CompactIDNO("SSRQ", "SG", "III_4", doc=-1, num=1)])
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+import ssrq_utils
+
+# cumulative import time of `ssrq_utils` in microseconds, see `python -X importtime`
+IMPORT_TIME_BUDGET = 100_000
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, check=True, text=True
+    )
+
+
+def _import_time(module: str) -> int:
+    # the lines have the form "import time: <self> | <cumulative> | <module>"
+    for line in _run(f"import {module}").stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} was not imported")
+
+
+def test_import_does_not_load_submodules():
+    modules = _run(
+        "import sys, ssrq_utils, ssrq_utils.lang.display; print(*sorted(sys.modules), sep='\\n')"
+    ).stdout.splitlines()
+
+    assert "pydantic" not in modules
+    assert "ssrq_utils.idno" not in modules
+    assert "ssrq_utils.urn" not in modules
+
+
+def test_import_time_is_within_budget():
+    # the best of a few runs, to be robust against a busy machine
+    assert min(_import_time("ssrq_utils") for _ in range(3)) < IMPORT_TIME_BUDGET
+
+
+def test_submodules_are_loaded_on_access():
+    assert ssrq_utils.idno.model.IDNO.__name__ == "IDNO"
+    assert ssrq_utils.urn.index.LinkIndex.__name__ == "LinkIndex"
+    assert {"idno", "urn"} <= set(dir(ssrq_utils))
+    assert {"cache", "volume"} <= set(dir(ssrq_utils.idno))
+
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        ssrq_utils.unknown  # noqa: B018
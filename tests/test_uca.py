@@ -3,7 +3,23 @@ from maturin_import_hook.settings import MaturinSettings
 
 maturin_import_hook.install(settings=MaturinSettings(uv=True))
 
-from ssrq_utils.uca import uca_complex_sort, uca_simple_sort  # noqa: E402
+import pytest  # noqa: E402
+
+from ssrq_utils.uca import (  # noqa: E402
+    Collator,
+    uca_bisect_left,
+    uca_bisect_right,
+    uca_complex_sort,
+    uca_external_sort,
+    uca_insort,
+    uca_merge,
+    uca_prefix_range,
+    uca_ranks,
+    uca_simple_sort,
+    uca_sort,
+    uca_top_k,
+    uca_unique,
+)
 
 
 def test_uca_simple_sort():
@@ -16,3 +32,163 @@ def test_uca_complex_sort():
     data = [{"name": "Apfel"}, {"name": "Äpfel"}, {"name": "apfel"}, {"name": "Banane"}]
     result = uca_complex_sort(data, "get", ("name",))
     assert result == [{"name": "apfel"}, {"name": "Apfel"}, {"name": "Äpfel"}, {"name": "Banane"}]
+
+
+def test_uca_ranks():
+    data = ["Banane", "Äpfel", "apfel", "Apfel", "Banane"]
+    ranks = uca_ranks(data)
+    assert ranks == [3, 2, 0, 1, 3]
+    assert [value for _, value in sorted(zip(ranks, data, strict=True))] == uca_simple_sort(data)
+    assert uca_ranks(data[:3]) == [2, 1, 0]
+
+
+def test_uca_sort_in_parallel():
+    data = [f"{name} {i}" for i in range(100) for name in ("Apfel", "Äpfel", "apfel", "Banane")]
+    assert uca_simple_sort(data, parallel_threshold=1) == uca_simple_sort(data)
+    assert uca_ranks(data, parallel_threshold=1) == uca_ranks(data)
+
+
+def test_uca_sort():
+    data = [("Banane", 1), ("Apfel", 2), ("apfel", 3), ("Banane", 4), ("Äpfel", 5)]
+    calls = []
+
+    def key(item: tuple[str, int]) -> str:
+        calls.append(item)
+        return item[0]
+
+    result = uca_sort((item for item in data), key=key)
+    assert result == [("apfel", 3), ("Apfel", 2), ("Äpfel", 5), ("Banane", 1), ("Banane", 4)]
+    assert calls == data
+    assert uca_sort(data, key=key, reverse=True) == [
+        ("Banane", 1),
+        ("Banane", 4),
+        ("Äpfel", 5),
+        ("Apfel", 2),
+        ("apfel", 3),
+    ]
+    assert uca_sort(["Banane", "Äpfel", "apfel"]) == ["apfel", "Äpfel", "Banane"]
+
+
+def test_uca_sort_errors():
+    with pytest.raises(TypeError):
+        uca_sort([1, 2])
+    with pytest.raises(KeyError):
+        uca_sort([{"name": "Apfel"}], key=lambda item: item["title"])
+
+
+@pytest.mark.parametrize(
+    ("strength", "expected"),
+    [
+        ("primary", ["Zürich", "zürich", "zurich"]),
+        ("secondary", ["Zürich", "zürich"]),
+        ("tertiary", ["Zürich"]),
+        ("identical", ["Zürich"]),
+    ],
+)
+def test_collator_strength(strength: str, expected: list[str]):
+    collator = Collator(strength=strength)
+    assert [
+        value for value in ("Zürich", "zürich", "zurich") if collator.compare("Zürich", value) == 0
+    ] == expected
+
+
+def test_collator():
+    collator = Collator(tailoring="ducet", shifting=False)
+    data = ["Banane", "Äpfel", "apfel", "Apfel"]
+    assert (collator.tailoring, collator.shifting, collator.strength) == (
+        "ducet",
+        False,
+        "identical",
+    )
+    assert collator.sort(data) == ["apfel", "Apfel", "Äpfel", "Banane"]
+    assert sorted(data, key=collator.sort_key) == collator.sort(data)
+    assert collator.compare("apfel", "Apfel") == -1
+    assert collator.ranks(data) == [3, 2, 0, 1]
+    assert collator.sorted_merge(["apfel", "Banane"], ["Apfel", "Äpfel"]) == collator.sort(data)
+    assert collator.sorted_merge(
+        [("Apfel", 1)], [("Apfel", 2), ("Birne", 3)], key=lambda item: item[0]
+    ) == [("Apfel", 1), ("Apfel", 2), ("Birne", 3)]
+    with pytest.raises(ValueError):  # noqa: PT011
+        Collator(strength="quaternary")
+
+
+def test_uca_bisect():
+    data = ["apfel", "Apfel", "Äpfel", "Banane", "Birne"]
+    assert uca_bisect_left(data, "Äpfel") == data.index("Äpfel")
+    assert uca_bisect_right(data, "Äpfel") == data.index("Äpfel") + 1
+    assert uca_bisect_left(data, "Aprikose") == data.index("Banane")
+    assert uca_bisect_left(data, "Zwetschge", lo=1, hi=3) == data.index("Banane")
+    records = [{"name": name} for name in data]
+    assert uca_bisect_right(records, "Banane", key=lambda record: record["name"]) == len(data) - 1
+
+
+def test_uca_insort():
+    data = ["apfel", "Äpfel", "Banane"]
+    assert uca_insort(data, "Apfel") == 1
+    assert uca_insort(data, "Zwetschge") == len(data) - 1
+    assert data == uca_simple_sort(data)
+    records = [("Apfel", 1)]
+    uca_insort(records, ("Apfel", 2), key=lambda record: record[0])
+    assert records == [("Apfel", 1), ("Apfel", 2)]
+
+
+def test_uca_prefix_range():
+    data = uca_simple_sort(["Zug", "Zürich", "Zurich", "zürcher", "Zurzach", "Basel", "Zürs"])
+    lo, hi = uca_prefix_range(data, "Zür")
+    assert sorted(data[lo:hi]) == ["Zurich", "Zurzach", "Zürich", "Zürs", "zürcher"]
+    assert uca_prefix_range(data, "Genf") == (1, 1)
+    assert Collator(strength="secondary").prefix_range(data, "Zug") == (data.index("Zug"), 2)
+
+
+def test_uca_merge():
+    first = iter(["apfel", "Banane", "Birne"])
+    second = iter(["Apfel", "Äpfel", "Zwetschge"])
+    assert list(uca_merge(first, second, [])) == uca_simple_sort(
+        ["apfel", "Banane", "Birne", "Apfel", "Äpfel", "Zwetschge"]
+    )
+    merged = uca_merge(
+        [("Apfel", 1), ("Birne", 1)],
+        [("Apfel", 2)],
+        key=lambda item: item[0],
+    )
+    assert list(merged) == [("Apfel", 1), ("Apfel", 2), ("Birne", 1)]
+    assert list(uca_merge(["Birne", "Apfel"], ["Banane"], reverse=True)) == [
+        "Birne",
+        "Banane",
+        "Apfel",
+    ]
+
+
+@pytest.mark.parametrize("run_size", [1, 3, 100])
+def test_uca_external_sort(run_size: int):
+    data = [(name, i) for i, name in enumerate(["Banane", "Äpfel", "apfel", "Banane", "Apfel"] * 3)]
+    result = uca_external_sort(
+        (item for item in data), key=lambda item: item[0], reverse=True, run_size=run_size
+    )
+    assert list(result) == uca_sort(data, key=lambda item: item[0], reverse=True)
+    with pytest.raises(ValueError):  # noqa: PT011
+        uca_external_sort(data, run_size=0)
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 10])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_uca_top_k(k: int, reverse: bool):
+    data = [(name, i) for i, name in enumerate(["Banane", "Äpfel", "apfel", "Banane", "Apfel"])]
+    assert (
+        uca_top_k(data, k, key=lambda item: item[0], reverse=reverse)
+        == uca_sort(data, key=lambda item: item[0], reverse=reverse)[:k]
+    )
+
+
+@pytest.mark.parametrize(
+    ("strength", "expected"),
+    [
+        ("primary", ["Zug", "Zürich"]),
+        ("secondary", ["Zug", "Zurich", "Zürich"]),
+        ("identical", ["Zug", "zurich", "Zurich", "Zürich"]),
+    ],
+)
+def test_uca_unique(strength: str, expected: list[str]):
+    data = ["Zürich", "Zurich", "Zug", "zurich", "Zürich"]
+    assert uca_unique(data, strength=strength) == expected
+    assert Collator(strength=strength).unique(data) == expected
@@ -1,7 +1,8 @@
 import pytest
 
+from ssrq_utils.idno import codec as idno_codec
 from ssrq_utils.idno import model as idno_model
-from ssrq_utils.urn import model
+from ssrq_utils.urn import codec, index, model
 
 
 @pytest.mark.parametrize(
@@ -40,3 +41,151 @@ def test_urn_model_can_is_hashable_if_casting_is_false():
 def test_urn_model_validate_string_fails_for_invalid_urn():
     with pytest.raises(ValueError):  # noqa: PT011
         model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-58-1.0-1", urn_prefix="urn:foo:")
+
+
+def test_urn_model_is_hashable_if_casting_is_true():
+    model_instance = model.URN.model_validate_string(
+        "urn:ssrq:SSRQ-SG-III_4-58-1", cast_to_idno=True
+    )
+    assert isinstance(hash(model_instance), int)
+
+
+def test_urn_model_validate_string_keeps_further_separators():
+    model_instance = model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-58-1#a#b")
+    assert model_instance.fragment == "a#b"
+
+
+def test_urn_model_validate_strings():
+    urns = [
+        "urn:ssrq:SSRQ-SG-III_4-58-1",
+        "urn:ssrq:SSRQ-SG-III_4-58-1#123",
+        "urn:ssrq:SSRQ-SG-III_4-58-1",
+        "urn:ssrq:SSRQ-ZH-NF_I_1_3-1-1#a#b",
+    ]
+    parsed = model.URN.model_validate_strings(iter(urns))
+    assert parsed == [model.URN.model_validate_string(urn) for urn in urns]
+    assert parsed[0] is parsed[2]
+    assert len(set(parsed)) == len(urns) - 1
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        model.URN.model_validate_strings(["urn:ssrq:SSRQ-SG-III_4-58-1", "urn:foo:bar"])
+
+
+def test_urn_model_parses_idno_lazily():
+    model_instance = model.URN.model_validate_strings(["urn:ssrq:SSRQ-SG-III_4-58-1#123"])[0]
+    assert "parsed_idno" not in model_instance.__dict__
+
+    idno = model_instance.parsed_idno
+    assert idno == idno_model.IDNO.model_validate_string("SSRQ-SG-III_4-58-1")
+    assert model_instance.parsed_idno is idno
+    assert isinstance(hash(model_instance), int)
+
+    casted = model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-58-1", cast_to_idno=True)
+    assert casted.parsed_idno is casted.idno
+
+
+def _idnos(*idnos: str) -> list[idno_model.IDNO]:
+    return [idno_model.IDNO.model_validate_string(idno) for idno in idnos]
+
+
+def test_link_index():
+    urns = model.URN.model_validate_strings(
+        [
+            "urn:ssrq:SSRQ-SG-III_4-58-1#p1",
+            "urn:ssrq:SSRQ-SG-III_4-58-1#p1",
+            "urn:ssrq:SSRQ-SG-III_4-58-1",
+            "urn:ssrq:SSRQ-SG-III_4-3-1",
+            "urn:ssrq:SSRQ-ZH-NF_I_1_3-1-1#a",
+        ]
+    )
+    link_index = index.LinkIndex()
+    link_index.add("SSRQ-ZH-NF_I_1_3-2-1", urns)
+    link_index.add("SSRQ-ZH-NF_I_1_3-2-1", urns[:1])
+    link_index.add("SSRQ-ZH-NF_I_1_3-5-1", urns[:1])
+
+    targets = _idnos("SSRQ-SG-III_4-3-1", "SSRQ-SG-III_4-58-1", "SSRQ-ZH-NF_I_1_3-1-1")
+    assert [refs.target for refs in link_index] == targets
+    assert len(link_index) == len(targets)
+    assert targets[1] in link_index
+    assert link_index.references(targets[1]) == (
+        targets[1],
+        {
+            "p1": {"SSRQ-ZH-NF_I_1_3-2-1", "SSRQ-ZH-NF_I_1_3-5-1"},
+            None: {"SSRQ-ZH-NF_I_1_3-2-1"},
+        },
+    )
+    assert [refs.target for refs in link_index.find("SSRQ", "SG", "III_4")] == targets[:2]
+    assert [
+        refs.target for refs in link_index.range(*_idnos("SSRQ-SG-III_4-4-1", "SSRQ-ZH-A-1-1"))
+    ] == [targets[1]]
+    assert link_index.references(*_idnos("SSRQ-SG-III_4-1-1")) is None
+
+
+def test_link_index_reindexes_sources():
+    urns = model.URN.model_validate_strings(
+        ["urn:ssrq:SSRQ-SG-III_4-58-1#p1", "urn:ssrq:SSRQ-SG-III_4-3-1"]
+    )
+    link_index = index.LinkIndex()
+    link_index.add("a", urns)
+    link_index.add("b", urns[:1])
+
+    link_index.replace("a", urns[1:])
+    target = urns[0].parsed_idno
+    assert link_index.references(target) == (target, {"p1": {"b"}})
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        link_index.replace("b", [model.URN(idno="SSRQ-invalid")])
+    assert link_index.references(target) == (target, {"p1": {"b"}})
+
+    link_index.remove("b")
+    link_index.remove("unknown")
+    assert target not in link_index
+    assert [refs.target for refs in link_index] == [urns[1].parsed_idno]
+    assert link_index.sources == {"a"}
+
+
+def test_link_index_keeps_targets_with_equal_int_sort_keys():
+    first, second = model.URN(idno="SSRQ-ZH-A-5-1"), model.URN(idno="SSRQ-ZH-A-5.0-1")
+    link_index = index.LinkIndex()
+    link_index.add("x", [first])
+    link_index.add("y", [second])
+
+    assert [refs.target for refs in link_index.find("SSRQ", "ZH", "A")] == [
+        first.parsed_idno,
+        second.parsed_idno,
+    ]
+
+    link_index.remove("y")
+    assert first.parsed_idno in link_index
+    assert second.parsed_idno not in link_index
+    assert list(link_index) == [(first.parsed_idno, {None: {"x"}})]
+    assert link_index.references(second.parsed_idno) is None
+
+
+def test_urn_codec_round_trip():
+    urns = [
+        model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-58-1#p1"),
+        model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-58-1#p1", cast_to_idno=True),
+        model.URN.model_validate_string("urn:ssrq:SDS-NE-4-1.A.1-1"),
+        model.URN.model_validate_string("urn:ssrq:SSRQ-ZH-NF_I_1-lit#"),
+        model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-58-1#p1"),
+        model.URN.model_validate_string("urn:ssrq:SSRQ-SG-III_4-058-1#a"),
+        model.URN(idno="foo"),
+    ]
+    decoded = codec.decode_urns(memoryview(codec.encode_urns(urns)))
+
+    assert decoded == urns
+    assert decoded[5].idno == "SSRQ-SG-III_4-058-1"
+    assert [type(urn.idno) for urn in decoded] == [type(urn.idno) for urn in urns]
+    assert decoded[0] is decoded[4]
+    assert decoded[0].parsed_idno == decoded[1].idno
+    assert len(set(decoded)) == len(urns) - 1
+
+
+def test_urn_codec_fails_for_invalid_input():
+    buffer = codec.encode_urns([model.URN(idno="SSRQ-SG-III_4-58-1", fragment="p1")])
+
+    with pytest.raises(ValueError, match="not created by this codec"):
+        codec.decode_urns(idno_codec.encode_idnos([]))
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        codec.decode_urns(buffer[:-1])